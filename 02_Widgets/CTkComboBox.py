@@ -65,3 +65,273 @@ combobox2 = customtkinter.CTkComboBox(
 combobox2.pack(padx=20, pady=20)
 
 app.mainloop()
+
+
+# Example 3: Searchable combobox for huge value lists (50k product codes)
+# CTkComboBox builds one tkinter.Menu entry per value, so a 50k list takes seconds to build and open.
+# SearchableComboBox never builds that menu. Instead:
+#   - ValueIndex keeps a sorted prefix list (bisect) and a trigram index over the values
+#   - typing in the entry filters: prefix matches first, then substring, then fuzzy (shared trigrams)
+#   - only the top max_results matches are kept, and the popup shows them through a small,
+#     fixed pool of row buttons that are re-bound while scrolling (virtualized)
+#   - values can be a callable returning an iterable; it is consumed and indexed lazily in chunks
+from bisect import bisect_left
+from collections import Counter
+from itertools import islice
+
+
+class ValueIndex:
+    """ prefix (sorted list + bisect) and trigram index over a list of strings """
+    def __init__(self, values=()):
+        self.values = []
+        self._folded = []
+        self._prefix = []           # sorted (folded value, id)
+        self._trigrams = {}         # trigram → ids, ascending
+        self.extend(values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def extend(self, values):
+        start = len(self.values)
+        new = list(values)
+        folded = [value.casefold() for value in new]
+        self.values += new
+        self._folded += folded
+        self._prefix += zip(folded, range(start, start + len(new)))
+        self._prefix.sort()         # nearly sorted already when appending: timsort merges the runs
+        trigrams = self._trigrams
+        for i, text in enumerate(folded, start):
+            for gram in {text[j:j + 3] for j in range(len(text) - 2)}:
+                trigrams.setdefault(gram, []).append(i)
+
+    def search(self, query, limit=50):
+        """ → up to limit values: prefix matches, then substring matches, then fuzzy (shared trigram) matches """
+        q = query.casefold().strip()
+        if not q:
+            return self.values[:limit]
+        found, seen = [], set()
+
+        def take(i):
+            if i not in seen:
+                seen.add(i)
+                found.append(i)
+            return len(found) >= limit
+
+        prefix = self._prefix
+        at = bisect_left(prefix, (q,))
+        while at < len(prefix) and prefix[at][0].startswith(q):
+            if take(prefix[at][1]):
+                return [self.values[i] for i in found]
+            at += 1
+        folded = self._folded
+        if len(q) < 3:              # too short for trigrams: plain scan, stops as soon as limit is reached
+            for i, text in enumerate(folded):
+                if q in text and take(i):
+                    break
+            return [self.values[i] for i in found]
+        grams = sorted({q[j:j + 3] for j in range(len(q) - 2)}, key=lambda g: len(self._trigrams.get(g, ())))
+        rarest = self._trigrams.get(grams[0], ())
+        for i in rarest:            # every substring match contains the rarest trigram
+            if q in folded[i] and take(i):
+                return [self.values[i] for i in found]
+        # fuzzy: rank by shared trigrams, ignoring trigrams too common to tell values apart
+        common = max(100, len(self.values) // 10)
+        useful = [self._trigrams[g] for g in grams if 0 < len(self._trigrams.get(g, ())) <= common]
+        shared = Counter()
+        for ids in useful:
+            shared.update(ids)
+        needed = max(1, (len(useful) + 1) // 2)
+        for i, count in shared.most_common():
+            if count < needed or take(i):
+                break
+        return [self.values[i] for i in found]
+
+
+class SearchableComboBox(customtkinter.CTkComboBox):
+    def __init__(self, master, values=(), max_results=200, visible_rows=8, row_height=28, chunk_size=2000, **kwargs):
+        super().__init__(master, values=[], **kwargs)
+        if kwargs.get("variable") is None:
+            self._entry.delete(0, "end")
+        self.max_results = max_results
+        self.visible_rows = visible_rows
+        self.row_height = row_height
+        self.chunk_size = chunk_size
+        self._results = []
+        self._first = 0             # first result shown in the popup
+        self._active = 0            # result highlighted for keyboard selection
+        self._popup = None
+        self._search_job = self._load_job = None
+        self._entry.bind("<KeyRelease>", self._on_key, add="+")
+        self._entry.bind("<Down>", lambda e: self._move(1), add="+")
+        self._entry.bind("<Up>", lambda e: self._move(-1), add="+")
+        self._entry.bind("<Return>", lambda e: self._choose(self._active), add="+")
+        self._entry.bind("<Escape>", lambda e: self._close_popup(), add="+")
+        self._entry.bind("<FocusOut>", lambda e: self.after(150, self._close_popup), add="+")
+        self._set_source(values)
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "values" in kwargs:
+            self._set_source(kwargs.pop("values"))
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    # --- data source ---
+    def _set_source(self, values):
+        if self._load_job is not None:
+            self.after_cancel(self._load_job)
+            self._load_job = None
+        self.index = ValueIndex()
+        self._values = self.index.values        # CTkComboBox uses this for hover and index()
+        if callable(values):
+            self._source = iter(values())
+            self._load_job = self.after_idle(self._load_chunk)
+        else:
+            self.index.extend(values)
+
+    def _load_chunk(self):
+        chunk = list(islice(self._source, self.chunk_size))
+        if not chunk:
+            self._load_job = None
+            return
+        self.index.extend(chunk)
+        if self._popup_open():
+            self._search(self.get())            # let the open popup pick up the new values
+        self._load_job = self.after(1, self._load_chunk)
+
+    # --- filtering ---
+    def _on_key(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape"):
+            return
+        if self._search_job is None:            # one search per burst of key events
+            self._search_job = self.after_idle(lambda: self._search(self.get()))
+
+    def _search(self, query):
+        self._search_job = None
+        self._results = self.index.search(query, self.max_results)
+        self._first = self._active = 0
+        if self._results:
+            self._open_popup()
+        else:
+            self._close_popup()
+
+    def _clicked(self, event=None):
+        if self._popup_open():
+            self._close_popup()
+        elif self._state != "disabled":
+            self._search("")
+
+    def _choose(self, i):
+        if self._popup_open() and i < len(self._results):
+            self._close_popup()
+            self._dropdown_callback(self._results[i])     # sets the entry and calls command
+
+    # --- virtualized popup ---
+    def _popup_open(self):
+        return self._popup is not None and self._popup.winfo_ismapped()
+
+    def _build_popup(self):
+        self._popup = customtkinter.CTkToplevel(self)
+        self._popup.withdraw()
+        self._popup.overrideredirect(True)
+        frame = customtkinter.CTkFrame(self._popup, corner_radius=0, border_width=1)
+        frame.pack(fill="both", expand=True)
+        frame.grid_columnconfigure(0, weight=1)
+        self._scrollbar = customtkinter.CTkScrollbar(frame, command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, rowspan=self.visible_rows, sticky="ns")
+        self._rows, self._texts = [], [None] * self.visible_rows
+        for r in range(self.visible_rows):
+            row = customtkinter.CTkButton(frame, text="", anchor="w", height=self.row_height, corner_radius=0,
+                                          fg_color="transparent", command=lambda r=r: self._choose(self._first + r))
+            row.grid(row=r, column=0, sticky="ew", padx=1)
+            row.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1))
+            row.bind("<Button-4>", lambda e: self._scroll(-1))
+            row.bind("<Button-5>", lambda e: self._scroll(1))
+            self._rows.append(row)
+
+    def _open_popup(self):
+        if self._popup is None:
+            self._build_popup()
+        self._render()
+        if not self._popup.winfo_ismapped():
+            height = self.visible_rows * self.row_height + 2
+            self._popup.geometry(f"{self.winfo_width()}x{height}+{self.winfo_rootx()}+{self.winfo_rooty() + self.winfo_height()}")
+            self._popup.deiconify()
+            self._popup.lift()
+
+    def _close_popup(self):
+        if self._popup is not None:
+            self._popup.withdraw()
+
+    def _render(self):
+        total = len(self._results)
+        for r, row in enumerate(self._rows):
+            i = self._first + r
+            text = self._results[i] if i < total else ""
+            state = (text, i == self._active)
+            if state != self._texts[r]:         # only touch rows whose content changed
+                row.configure(text=text, fg_color=row.cget("hover_color") if i == self._active else "transparent")
+                self._texts[r] = state
+        if total:
+            self._scrollbar.set(self._first / total, min(1.0, (self._first + self.visible_rows) / total))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+    def _scroll(self, rows):
+        self._first = max(0, min(self._first + rows, len(self._results) - self.visible_rows))
+        self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._first = 0
+            self._scroll(int(float(amount) * len(self._results)))
+        else:
+            self._scroll(int(amount) * (self.visible_rows if unit == "pages" else 1))
+
+    def _move(self, delta):
+        if not self._popup_open():
+            self._search(self.get())
+            return
+        self._active = max(0, min(self._active + delta, len(self._results) - 1))
+        if not self._first <= self._active < self._first + self.visible_rows:
+            self._first = max(0, self._active - (self.visible_rows - 1 if delta > 0 else 0))
+        self._render()
+
+import random
+random.seed(0)
+product_codes = [f"{random.choice(['PRD', 'SKU', 'ITM', 'BOX'])}-{random.randint(0, 999999):06d}-"
+                 f"{random.choice(['RED', 'BLU', 'GRN', 'BLK'])}" for _ in range(50_000)]
+
+def product_code_source():      # e.g. rows streamed from a database cursor
+    yield from product_codes
+
+app = customtkinter.CTk()
+searchable = SearchableComboBox(app, values=product_codes, width=260, command=combobox_callback)
+searchable.pack(padx=20, pady=20)
+lazy = SearchableComboBox(app, values=product_code_source, width=260, command=combobox_callback)
+lazy.pack(padx=20, pady=20)
+app.mainloop()
+
+
+# Example 4: Benchmark — stock CTkComboBox vs SearchableComboBox with 50k values
+import time
+
+def elapsed_ms(start):
+    app.update()
+    return (time.perf_counter() - start) * 1000
+
+app = customtkinter.CTk()
+start = time.perf_counter()
+customtkinter.CTkComboBox(app, values=product_codes).pack()
+print(f"stock CTkComboBox create      {elapsed_ms(start):8.1f} ms")
+start = time.perf_counter()
+fast = SearchableComboBox(app, values=product_codes)
+fast.pack()
+print(f"SearchableComboBox create     {elapsed_ms(start):8.1f} ms")
+start = time.perf_counter()
+fast._search("")
+print(f"open popup (first 200)        {elapsed_ms(start):8.1f} ms")
+for query in ("P", "PRD-1", "PRD-12", "1234", "PRD-12345-RDE"):
+    start = time.perf_counter()
+    fast._search(query)
+    print(f"keystroke {query!r:<20}{elapsed_ms(start):8.1f} ms  ({len(fast._results)} matches)")
+app.destroy()
@@ -86,6 +86,266 @@ styled_entry.pack(padx=20, pady=20)
 disabled_entry = CTkEntry(app,placeholder_text="Disabled entry",state="disabled")
 disabled_entry.pack(padx=20, pady=20)
 app.mainloop()
+
+
+# Example 4: Debounced / throttled textvariable observer
+# A "write" trace fires synchronously on every keystroke, every paste and every programmatic insert.
+# ThrottledTrace sits between the variable and an expensive callback:
+#   wait_ms      → quiet time after the last write before the trailing call (debounce)
+#   leading      → also call right away on the first write after a quiet period
+#   trailing     → call once typing pauses (default True)
+#   max_wait_ms  → never hold a call back longer than this while writes keep coming (throttle)
+#   executor     → run callback(value) on a worker pool; on_result(value, result) is called on the
+#                  Tk thread, and results for values that were superseded meanwhile are discarded
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class ThrottledTrace:
+    def __init__(self, master, variable, callback, wait_ms=300, leading=False, trailing=True,
+                 max_wait_ms=None, executor=None, on_result=None, poll_ms=15):
+        self.master = master
+        self.variable = variable
+        self.callback = callback
+        self.wait_ms = wait_ms
+        self.leading = leading
+        self.trailing = trailing
+        self.max_wait_ms = max_wait_ms
+        self.executor = executor
+        self.on_result = on_result
+        self.poll_ms = poll_ms
+        self._timer = self._max_timer = self._poll_job = None
+        self._pending = False
+        self._last_value = None
+        self._generation = 0
+        self._in_flight = []        # (generation, value, future) submitted to the executor
+        self._writes = self._executed = self._stale = self._cancelled = 0
+        self._trace_id = variable.trace_add("write", self._on_write)
+
+    def stats(self):
+        return {"writes": self._writes, "executed": self._executed, "skipped": self._writes - self._executed,
+                "stale_results": self._stale, "cancelled_tasks": self._cancelled}
+
+    def _on_write(self, *args):
+        self._writes += 1
+        if self._timer is None:                 # first write after a quiet period
+            if self.leading:
+                self._fire()
+            else:
+                self._pending = True
+            if self.max_wait_ms is not None:
+                self._max_timer = self.master.after(self.max_wait_ms, self._on_max_wait)
+        else:
+            self._pending = True
+            self.master.after_cancel(self._timer)
+        self._timer = self.master.after(self.wait_ms, self._on_quiet)
+
+    def _on_quiet(self):
+        self._timer = None
+        if self._max_timer is not None:
+            self.master.after_cancel(self._max_timer)
+            self._max_timer = None
+        if self._pending and self.trailing:
+            self._fire()
+        self._pending = False
+
+    def _on_max_wait(self):
+        self._max_timer = None
+        if self._pending:
+            self._fire()
+        if self._timer is not None:             # still inside the burst: keep the throttle running
+            self._max_timer = self.master.after(self.max_wait_ms, self._on_max_wait)
+
+    def _fire(self):
+        self._pending = False
+        value = self.variable.get()
+        if value == self._last_value:           # e.g. typed a character and deleted it again
+            return
+        self._last_value = value
+        self._executed += 1
+        if self.executor is None:
+            self.callback(value)
+            return
+        self._generation += 1
+        for entry in self._in_flight[:]:        # older tasks are pointless now (pool tasks cancel only if not started)
+            if entry[2].cancel():
+                self._in_flight.remove(entry)
+                self._cancelled += 1
+        self._in_flight.append((self._generation, value, self.executor.submit(self.callback, value)))
+        if self._poll_job is None:
+            self._poll_job = self.master.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        # futures finish on worker threads; results are picked up here, on the Tk thread
+        self._poll_job = None
+        for entry in [e for e in self._in_flight if e[2].done()]:
+            self._in_flight.remove(entry)
+            generation, value, future = entry
+            if generation != self._generation:
+                self._stale += 1
+            elif self.on_result is not None:
+                self.on_result(value, future.result())
+        if self._in_flight:
+            self._poll_job = self.master.after(self.poll_ms, self._poll)
+
+    def flush(self):
+        """ deliver a pending call now instead of waiting for the quiet period """
+        if self._timer is not None:
+            self.master.after_cancel(self._timer)
+            self._on_quiet()
+
+    def detach(self):
+        self.variable.trace_remove("write", self._trace_id)
+        for job in (self._timer, self._max_timer, self._poll_job):
+            if job is not None:
+                self.master.after_cancel(job)
+        self._timer = self._max_timer = self._poll_job = None
+        self._pending = False
+
+# Example 5: Search-as-you-type with a slow query on a worker pool
+WORDS = [f"{a}{b}{c}" for a in "abcdefghij" for b in "klmnopqrst" for c in "uvwxyz0123"]
+
+def slow_search(text):          # runs on a worker thread: no Tk calls in here
+    time.sleep(0.2)
+    return [w for w in WORDS if w.startswith(text)][:10] if text else []
+
+def show_results(text, matches):
+    results_label.configure(text="\n".join(matches) or "(no matches)")
+    stats_label.configure(text=str(search_trace.stats()))
+
+app = CTk()
+search_var = StringVar(value="")
+CTkEntry(app, width=250, textvariable=search_var).pack(padx=20, pady=(20, 5))
+results_label = CTkLabel(app, text="", justify="left")
+results_label.pack(padx=20, pady=5)
+stats_label = CTkLabel(app, text="", wraplength=300)
+stats_label.pack(padx=20, pady=(5, 20))
+pool = ThreadPoolExecutor(max_workers=2)
+search_trace = ThrottledTrace(app, search_var, slow_search, wait_ms=150, max_wait_ms=600,
+                              executor=pool, on_result=show_results)
+
+# a programmatic burst (like a paste of 500 characters typed one by one) costs one query, not 500
+for ch in "abc" * 166:
+    search_var.set(search_var.get() + ch)
+app.mainloop()
+pool.shutdown(cancel_futures=True)
+print(search_trace.stats())
+
+
+# Example 6: Asynchronous validation (validators that touch disk or a service)
+# Tk runs validatecommand synchronously inside the event loop, so a slow validator freezes typing.
+# AsyncValidator runs the validator off the Tk thread instead:
+#   - coroutine functions run on an asyncio loop in a background thread (AsyncioRunner),
+#     plain functions on a ThreadPoolExecutor (or any executor you pass in)
+#   - input is debounced and stale validations are cancelled through ThrottledTrace (Example 4);
+#     a running coroutine is really cancelled, a running pool task just has its result discarded
+#   - results are applied on the Tk thread: border_color shows pending / valid / invalid
+# Keep cheap synchronous filtering (e.g. "digits only") in validatecommand; use this for the slow part.
+import asyncio, inspect, threading
+
+class AsyncioRunner:
+    """ executor-like adapter: submit(coroutine_function, *args) → concurrent.futures.Future """
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def submit(self, coroutine_function, *args):
+        return asyncio.run_coroutine_threadsafe(coroutine_function(*args), self.loop)
+
+    def shutdown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+class AsyncValidator:
+    COLORS = {"pending": "#E0A800", "valid": "#2FA572", "invalid": "#E5484D"}
+
+    def __init__(self, entry, variable, validator, executor=None, debounce_ms=150, colors=None, on_state=None):
+        """ validator(text) → bool, either a coroutine function or a plain (blocking) function;
+            on_state(state, text) is called on the Tk thread whenever the state changes """
+        if executor is None:
+            executor = AsyncioRunner() if inspect.iscoroutinefunction(validator) else ThreadPoolExecutor(max_workers=2)
+        self.entry = entry
+        self.variable = variable
+        self.executor = executor
+        self.colors = {**self.COLORS, **(colors or {})}
+        self.on_state = on_state
+        self.state = None
+        self._validated = {}        # text → "valid" | "invalid", so going back to a checked value is instant
+        self._trace_id = variable.trace_add("write", self._on_write)
+        self.trace = ThrottledTrace(entry, variable, validator, wait_ms=debounce_ms,
+                                    executor=executor, on_result=self._on_result)
+
+    def _set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.entry.configure(border_color=self.colors[state])
+            if self.on_state is not None:
+                self.on_state(state, self.variable.get())
+
+    def _on_write(self, *args):
+        self._set_state(self._validated.get(self.variable.get(), "pending"))
+
+    def _on_result(self, text, ok):
+        self._validated[text] = "valid" if ok else "invalid"
+        if text == self.variable.get():     # the user may have typed on since this was submitted
+            self._set_state(self._validated[text])
+
+    def stats(self):
+        return self.trace.stats()
+
+    def close(self):
+        self.variable.trace_remove("write", self._trace_id)
+        self.trace.detach()
+        self.executor.shutdown()
+
+# Example 7: Responsiveness harness with stub validators that sleep
+# Types a name character by character while a heartbeat measures how late the event loop runs.
+# A synchronous validatecommand with the same stub blocks for 0.5 s per key; the async one doesn't.
+TAKEN = {"admin", "root", "newuser"}
+
+async def username_available(name):       # stands in for a call to a local service
+    await asyncio.sleep(0.5)
+    return bool(name) and name not in TAKEN
+
+def username_available_blocking(name):     # same stub as a plain function (disk / pool style)
+    time.sleep(0.5)
+    return bool(name) and name not in TAKEN
+
+def run_harness(use_async, text="newuser2", key_interval_ms=40):
+    app = CTk()
+    variable = StringVar(value="")
+    entry = CTkEntry(app, width=250, border_width=2, textvariable=variable)
+    entry.pack(padx=20, pady=20)
+    if use_async:
+        validator = AsyncValidator(entry, variable, username_available)
+    else:
+        check = app.register(lambda proposed: username_available_blocking(proposed) or True)
+        entry.configure(validate="key", validatecommand=(check, "%P"))
+    lag = {"max": 0.0, "last": time.perf_counter()}
+
+    def heartbeat():
+        now = time.perf_counter()
+        lag["max"] = max(lag["max"], now - lag["last"] - 0.010)
+        lag["last"] = now
+        app.after(10, heartbeat)
+
+    def type_next(i=0):
+        if i < len(text):
+            entry.insert("end", text[i])
+            app.after(key_interval_ms, type_next, i + 1)
+        else:
+            app.after(1000, app.quit)
+
+    app.after(10, heartbeat)
+    app.after(100, type_next)
+    app.mainloop()
+    mode = "async validator" if use_async else "sync validatecommand"
+    print(f"{mode:<22} max event-loop lag {lag['max'] * 1000:7.1f} ms")
+    if use_async:
+        print(f"{'':<22} final state {validator.state!r} | {validator.stats()}")
+        validator.close()
+    app.destroy()
+
+run_harness(use_async=True)
+run_harness(use_async=False)
 """
 
 usage notes:
@@ -95,4 +355,8 @@ usage notes:
     ->  Use `state="disabled"` for non-editable entries.
     ->  Use `placeholder_text` for user-friendly hints (not available when using `textvariable`).
     ->  Combine with validation commands for input filtering.
+    ->  Don't run expensive work straight from a variable trace; debounce/throttle it and move slow
+        queries to a worker pool, discarding results that are already out of date (Example 4).
+    ->  validatecommand runs synchronously; validators that touch disk or a service should run
+        asynchronously and report back through border_color (Example 6).
 """
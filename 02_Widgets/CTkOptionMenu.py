@@ -63,6 +63,168 @@ disabled_menu.pack(padx=20, pady=20)
 app.mainloop()
 
 
+# Example 4: Shared dropdown models for forms with many option menus
+# Every CTkOptionMenu builds its own dropdown (one tkinter.Menu entry per value, font resolved per
+# menu), and configure(values=...) deletes and re-adds every entry. With 200 menus sharing 5 lists
+# that is 200 dropdowns holding the same items.
+# DropdownModel owns ONE dropdown menu per value list and is shared by reference count:
+#   - the menu items and the dropdown font are built once, however many option menus use them
+#   - whichever option menu opens the dropdown receives the selection
+#   - set_values() diffs old vs new values and only inserts/deletes the entries that changed,
+#     updating every option menu that shares the model
+#   - DropdownModel.for_values(master, values) returns the existing model for an equal list in the
+#     same window; the registry of a window is dropped when the window is destroyed
+#   - the menu is destroyed when the last option menu using it is destroyed
+import difflib, sys, time
+from customtkinter.windows.widgets.core_widget_classes import DropdownMenu
+
+class DropdownModel:
+    _shared = {}        # toplevel → {(values, menu options) → model}, see for_values()
+
+    def __init__(self, master, values, **menu_kwargs):
+        """ menu_kwargs: dropdown options of DropdownMenu (fg_color, hover_color, text_color, font) """
+        self.values = list(values)
+        self.refs = 0
+        self._owner = None          # option menu that opened the dropdown last
+        self._models = self._key = None     # registry entry, set by for_values()
+        self.menu = DropdownMenu(master=master.winfo_toplevel(), values=self.values,
+                                 command=self._dispatch, **menu_kwargs)
+        self.stats = {"items_built": len(self.values), "inserted": 0, "deleted": 0}
+
+    @classmethod
+    def for_values(cls, master, values, **menu_kwargs):
+        toplevel = master.winfo_toplevel()
+        models = cls._shared.get(toplevel)
+        if models is None:
+            models = cls._shared[toplevel] = {}
+            # closing a window through the window manager destroys it without calling destroy()
+            # (so release() never runs), but the <Destroy> binding still fires
+            toplevel.bind("<Destroy>", lambda event: cls._forget(toplevel, event), add="+")
+        key = (tuple(values), tuple(sorted(menu_kwargs.items())))
+        model = models.get(key)
+        if model is None:
+            model = models[key] = cls(master, values, **menu_kwargs)
+            model._models, model._key = models, key
+        return model
+
+    @classmethod
+    def _forget(cls, toplevel, event):
+        if event.widget is toplevel:    # <Destroy> of the toplevel also fires for its children
+            cls._shared.pop(toplevel, None)
+
+    def acquire(self, owner):
+        self.refs += 1
+
+    def release(self, owner):
+        self.refs -= 1
+        if self._owner is owner:
+            self._owner = None
+        if self.refs == 0:
+            if self._models is not None:
+                self._models.pop(self._key, None)
+            self.menu.destroy()
+
+    def open(self, owner, x, y):
+        self._owner = owner
+        self.menu.open(x, y)
+
+    def _dispatch(self, value):
+        if self._owner is not None:
+            self._owner._dropdown_callback(value)
+
+    def _label(self, value):        # same label layout as DropdownMenu._add_menu_commands
+        width = self.menu.cget("min_character_width")
+        if sys.platform.startswith("linux"):
+            return "  " + value.ljust(width) + "  "
+        return value.ljust(width)
+
+    def set_values(self, values):
+        values = list(values)
+        opcodes = difflib.SequenceMatcher(None, self.values, values, autojunk=False).get_opcodes()
+        for tag, i1, i2, j1, j2 in reversed(opcodes):      # back to front keeps earlier indices valid
+            if tag in ("replace", "delete"):
+                self.menu.delete(i1, i2 - 1)
+                self.stats["deleted"] += i2 - i1
+            if tag in ("replace", "insert"):
+                for offset, value in enumerate(values[j1:j2]):
+                    self.menu.insert_command(i1 + offset, label=self._label(value), compound="left",
+                                             command=lambda v=value: self._dispatch(v))
+                self.stats["inserted"] += j2 - j1
+        self.values[:] = values     # in place: every option menu holds this same list
+        if self._models is not None:
+            self._models.pop(self._key, None)
+            self._key = (tuple(values), self._key[1])
+            self._models[self._key] = self
+
+class SharedOptionMenu(CTkOptionMenu):
+    def __init__(self, master, model, **kwargs):
+        super().__init__(master, values=[], **kwargs)
+        self._dropdown_menu.destroy()           # drop the (empty) per-widget dropdown ...
+        self._dropdown_menu = model.menu        # ... and use the shared one
+        self._values = model.values
+        self.model = model
+        model.acquire(self)
+        if kwargs.get("variable") is None and model.values:
+            self.set(model.values[0])
+
+    def _open_dropdown_menu(self):
+        self.model.open(self, self.winfo_rootx(), self.winfo_rooty() + self._apply_widget_scaling(self._current_height))
+        self._close_on_next_click = True
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "values" in kwargs:      # changes the shared model, i.e. every menu using it
+            self.model.set_values(kwargs.pop("values"))
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def destroy(self):
+        self.model.release(self)
+        super().destroy()
+
+COUNTRIES = ["Austria", "Belgium", "Canada", "Denmark", "Egypt", "France", "Germany", "Hungary"]
+SIZES = ["XS", "S", "M", "L", "XL"]
+
+app = CTk()
+for values in (COUNTRIES, SIZES, COUNTRIES):
+    model = DropdownModel.for_values(app, values, font=("Helvetica", 14))
+    SharedOptionMenu(app, model, command=optionmenu_callback).pack(padx=20, pady=5)
+countries = DropdownModel.for_values(app, COUNTRIES, font=("Helvetica", 14))   # same model as the menus above
+CTkButton(app, text="Add Finland",      # both country menus get the new entry, 1 item inserted
+          command=lambda: countries.set_values(COUNTRIES[:5] + ["Finland"] + COUNTRIES[5:])).pack(padx=20, pady=10)
+app.mainloop()
+
+
+# Example 5: Benchmark — building a form of 200 option menus that share 5 value lists
+VALUE_LISTS = [[f"list {k} option {i}" for i in range(40)] for k in range(5)]
+
+def build_form(make_menu, count=200):
+    app = CTk()
+    frame = CTkFrame(app)
+    frame.pack()
+    start = time.perf_counter()
+    menus = [make_menu(frame, VALUE_LISTS[i % len(VALUE_LISTS)]) for i in range(count)]
+    for i, menu in enumerate(menus):
+        menu.grid(row=i // 10, column=i % 10)
+    app.update()
+    build = time.perf_counter() - start
+    # one list changes: an entry is inserted and another removed
+    new_values = VALUE_LISTS[0][:10] + ["new option"] + VALUE_LISTS[0][11:]
+    start = time.perf_counter()
+    for menu in menus[::len(VALUE_LISTS)]:
+        menu.configure(values=new_values)
+        if isinstance(menu, SharedOptionMenu):
+            break           # the model is shared: one update covers every menu using it
+    update = time.perf_counter() - start
+    app.destroy()
+    return build, update
+
+stock = build_form(lambda master, values: CTkOptionMenu(master, values=values, dropdown_font=("Helvetica", 14)))
+shared = build_form(lambda master, values: SharedOptionMenu(
+    master, DropdownModel.for_values(master, values, font=("Helvetica", 14))))
+print(f"{'':<22}{'build form':>12}{'update list':>13}")
+print(f"{'CTkOptionMenu':<22}{stock[0] * 1000:>9.1f} ms{stock[1] * 1000:>10.1f} ms")
+print(f"{'SharedOptionMenu':<22}{shared[0] * 1000:>9.1f} ms{shared[1] * 1000:>10.1f} ms")
+
+
 
 """
 usage notes:
@@ -72,4 +234,6 @@ usage notes:
         ->  `.get()` retrieves the currently selected value.
         ->  You can disable the widget using `state="disabled"`.
         ->  Customize colors and fonts for consistent UI theme.
+        ->  When many option menus show the same list, share one dropdown model instead of
+            building a dropdown per menu, and update it with a diff rather than a rebuild (Example 4).
 """
\ No newline at end of file
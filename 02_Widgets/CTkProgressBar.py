@@ -79,6 +79,266 @@ update_progress()
 app.mainloop()
 
 
+# Example 4: One animation clock for many progress bars
+# .start() and the after(...) pattern above give every bar its own timer; 300 bars = 300 timers and
+# 300 separate redraws per tick. AnimationScheduler drives all registered bars from ONE frame clock:
+#   - scheduler.set(bar, value) only records a target; many updates between two frames cost one redraw
+#   - bars whose value did not visibly change (less than half a pixel) are skipped
+#   - animated bars (the .start() behaviour) advance by elapsed time, so a late frame doesn't slow them
+#   - the clock stops when there is nothing to do and pauses while the window is minimized/hidden
+#   - stats() reports ticks, draws, skipped bars and frame times
+import time, tkinter
+from collections import deque
+
+class AnimationScheduler:
+    def __init__(self, window, fps=60):
+        self.window = window
+        self.interval_ms = max(1, round(1000 / fps))
+        self._bars = {}             # bar → [target, shown, animated mode or None, speed, pixels]
+        self._job = None
+        self._hidden = False
+        self._last_tick = None
+        self.frame_ms = deque(maxlen=240)       # work per tick
+        self.interval_ms_seen = deque(maxlen=240)
+        self.ticks = self.draws = self.skipped = 0
+        window.bind("<Unmap>", self._on_map_event, add="+")
+        window.bind("<Map>", self._on_map_event, add="+")
+
+    def register(self, bar, animate=False):
+        """ animate=True replaces bar.start(): the bar loops / oscillates on the shared clock """
+        mode = bar.cget("mode")
+        speed = bar.cget("determinate_speed") / 50 if mode == "determinate" else bar.cget("indeterminate_speed")
+        vertical = bar.cget("orientation") == "vertical"
+        pixels = max(1, bar.winfo_reqheight() if vertical else bar.winfo_reqwidth())
+        self._bars[bar] = [bar.get(), bar.get(), mode if animate else None, speed, pixels]
+        self._wake()
+
+    def unregister(self, bar):
+        self._bars.pop(bar, None)
+
+    def set(self, bar, value):
+        self._bars[bar][0] = min(1.0, max(0.0, value))
+        self._wake()
+
+    def _on_map_event(self, event):
+        if event.widget is not self.window:     # the window's bindtag is shared by its children
+            return
+        self._hidden = event.type == tkinter.EventType.Unmap
+        if self._hidden and self._job is not None:
+            self.window.after_cancel(self._job)
+            self._job = None
+        self._last_tick = None
+        self._wake()
+
+    def _wake(self):
+        if self._job is None and not self._hidden:
+            self._job = self.window.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        self._job = None
+        start = time.perf_counter()
+        steps = 1.0 if self._last_tick is None else (start - self._last_tick) * 1000 / 20   # .start() moves once per 20 ms
+        if self._last_tick is not None:
+            self.interval_ms_seen.append((start - self._last_tick) * 1000)
+        self._last_tick = start
+        busy = False
+        for bar, state in self._bars.items():
+            target, shown, animated, speed, pixels = state
+            if animated:
+                if animated == "determinate":
+                    bar.set((bar.get() + speed * steps) % 1.0)
+                else:
+                    bar._indeterminate_value += speed * steps
+                    bar._draw(no_color_updates=True)
+                self.draws += 1
+                busy = True
+            elif abs(target - shown) * pixels >= 0.5:
+                bar.set(target)
+                state[1] = target
+                self.draws += 1
+            else:
+                self.skipped += 1
+        self.ticks += 1
+        self.frame_ms.append((time.perf_counter() - start) * 1000)
+        if busy:
+            self._wake()
+        else:
+            self._last_tick = None  # idle until the next set()
+
+    def stats(self):
+        frames = sorted(self.frame_ms)
+        return {"ticks": self.ticks, "draws": self.draws, "skipped": self.skipped,
+                "frame_ms_avg": sum(frames) / len(frames) if frames else 0.0,
+                "frame_ms_p95": frames[int(len(frames) * 0.95)] if frames else 0.0,
+                "frame_ms_max": frames[-1] if frames else 0.0,
+                "interval_ms_avg": sum(self.interval_ms_seen) / len(self.interval_ms_seen) if self.interval_ms_seen else 0.0}
+
+# Example 5: Dashboard with 300 job bars on one clock
+import random
+
+app = CTk()
+app.title("300 jobs")
+dashboard = CTkScrollableFrame(app, width=700, height=500)
+dashboard.pack(fill="both", expand=True, padx=10, pady=10)
+scheduler = AnimationScheduler(app, fps=60)
+jobs = []
+for i in range(300):
+    bar = CTkProgressBar(dashboard, width=100, height=8)
+    bar.grid(row=i // 6, column=i % 6, padx=5, pady=4)
+    bar.set(0)
+    scheduler.register(bar, animate=(i % 50 == 0))     # a few "waiting" bars animate
+    jobs.append([bar, 0.0])
+
+def simulate_work():
+    # job updates arrive far more often than frames; only the latest value per bar gets drawn
+    for job in random.sample(jobs, 60):
+        job[1] = min(1.0, job[1] + random.random() * 0.01)
+        scheduler.set(job[0], job[1])
+    app.after(5, simulate_work)
+
+simulate_work()
+app.after(10_000, app.quit)
+app.mainloop()
+print(scheduler.stats())
+
+
+# Example 6: Progress reporting from worker pools
+# Tk widgets may only be touched from the Tk thread, so workers must never call bar.set() themselves,
+# and a queue message per work item is a lot of traffic. Instead:
+#   - ProgressReporter gives every worker (thread or process) its own counter slot; a worker only
+#     ever adds to its own slot, so advance() needs no lock (a plain list for threads, shared
+#     memory via multiprocessing.Array for processes)
+#   - ProgressBridge samples the sum of all slots on the Tk thread at a fixed rate and applies it to
+#     one or many bars (directly or through an AnimationScheduler), with throughput and ETA
+# Process pools: pass the reporter to the workers with initializer=set_worker_reporter,
+# initargs=(reporter,) and call worker_reporter.advance() in the task. The task function and this
+# code must then live in an importable module, not in a script like this one.
+import itertools, multiprocessing, threading
+from collections import namedtuple
+
+Progress = namedtuple("Progress", ["done", "total", "fraction", "rate", "eta"])   # rate: items/s, eta: s
+
+class ProgressReporter:
+    def __init__(self, total, slots=64, processes=False):
+        self.total = total
+        if processes:
+            self._counts = multiprocessing.Array("q", slots, lock=False)
+            self._next_slot = multiprocessing.Value("i", 0)
+        else:
+            self._counts = [0] * slots
+            self._next_slot = itertools.count()
+        self._local = threading.local()
+
+    def __getstate__(self):         # sent to worker processes: the shared memory, not the thread-local
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _claim_slot(self):
+        if isinstance(self._next_slot, itertools.count):
+            slot = next(self._next_slot)
+        else:
+            with self._next_slot.get_lock():
+                slot = self._next_slot.value
+                self._next_slot.value += 1
+        if slot >= len(self._counts):
+            raise RuntimeError(f"more than {len(self._counts)} workers report to this ProgressReporter")
+        return slot
+
+    def advance(self, n=1):
+        """ called by workers """
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            slot = self._local.slot = self._claim_slot()
+        self._counts[slot] += n
+
+    def completed(self):
+        return sum(self._counts)
+
+worker_reporter = None
+
+def set_worker_reporter(reporter):      # ProcessPoolExecutor initializer
+    global worker_reporter
+    worker_reporter = reporter
+
+class ProgressBridge:
+    def __init__(self, window, reporter, bars, rate_hz=10, scheduler=None, on_update=None, smoothing=0.3):
+        self.window = window
+        self.reporter = reporter
+        self.bars = bars
+        self.interval_ms = max(1, round(1000 / rate_hz))
+        self.scheduler = scheduler
+        self.on_update = on_update
+        self.smoothing = smoothing      # weight of the newest sample in the throughput average
+        self._rate = None
+        self._last = (time.perf_counter(), 0)
+        self._job = window.after(self.interval_ms, self._sample)
+
+    def _sample(self):
+        now, done = time.perf_counter(), self.reporter.completed()
+        last_time, last_done = self._last
+        instant = (done - last_done) / (now - last_time)
+        self._rate = instant if self._rate is None else self.smoothing * instant + (1 - self.smoothing) * self._rate
+        self._last = (now, done)
+        total = self.reporter.total
+        fraction = min(1.0, done / total) if total else 1.0
+        eta = (total - done) / self._rate if self._rate else None
+        for bar in self.bars:
+            if self.scheduler is not None:
+                self.scheduler.set(bar, fraction)
+            elif bar.get() != fraction:
+                bar.set(fraction)
+        if self.on_update is not None:
+            self.on_update(Progress(done, total, fraction, self._rate, 0.0 if done >= total else eta))
+        self._job = None if done >= total else self.window.after(self.interval_ms, self._sample)
+
+    def stop(self):
+        if self._job is not None:
+            self.window.after_cancel(self._job)
+            self._job = None
+
+def format_eta(seconds):
+    if seconds is None:
+        return "--:--"
+    minutes, seconds = divmod(int(seconds + 0.5), 60)
+    return f"{minutes // 60}:{minutes % 60:02d}:{seconds:02d}" if minutes >= 60 else f"{minutes}:{seconds:02d}"
+
+# Example 7: A thread pool processing 2000 items, one overall bar plus a compact bar in the header
+from concurrent.futures import ThreadPoolExecutor
+
+def process_item(reporter, item):
+    time.sleep(random.uniform(0.005, 0.05))     # the real work
+    reporter.advance()
+
+def show_progress(progress):
+    status.configure(text=f"{progress.done}/{progress.total} · {progress.rate or 0:.0f} items/s · "
+                          f"ETA {format_eta(progress.eta)}")
+
+app = CTk()
+app.title("Worker progress")
+header_bar = CTkProgressBar(app, width=120, height=6)
+header_bar.pack(padx=20, pady=(15, 5), anchor="e")
+overall_bar = CTkProgressBar(app, width=400)
+overall_bar.pack(padx=20, pady=10)
+status = CTkLabel(app, text="")
+status.pack(padx=20, pady=(0, 15))
+for bar in (header_bar, overall_bar):
+    bar.set(0)
+
+items = range(2000)
+reporter = ProgressReporter(total=len(items))
+pool = ThreadPoolExecutor(max_workers=8)
+for item in items:
+    pool.submit(process_item, reporter, item)
+bridge = ProgressBridge(app, reporter, [header_bar, overall_bar], rate_hz=10, on_update=show_progress)
+app.mainloop()
+pool.shutdown(cancel_futures=True)
+
+
 
 """
     usage notes:
@@ -88,4 +348,8 @@ app.mainloop()
         ->  .step() is useful for manual updates in determinate mode.
         ->  Customize progress_color to match your theme.
         ->  Both orientations ("horizontal" and "vertical") are supported.
+        ->  With many bars, drive them from one shared clock and only redraw bars whose value
+            changed, instead of one after() timer per bar (Example 4).
+        ->  Never call .set() from worker threads; let workers bump a counter and sample it from
+            the Tk thread at a fixed rate (Example 6).
 """
\ No newline at end of file
@@ -93,6 +93,257 @@ class FullApp(CTk):
 FullApp().mainloop()
 
 
+# Example 4: Virtualized list for very large data (50k+ rows)
+# A plain scrollable frame keeps one live widget per row. This subclass only keeps enough row
+# widgets to fill the visible area, recycles them while scrolling and binds them to the data by
+# index. Row heights may vary: they are cached in a prefix-sum list, so the first visible row is
+# found with a bisect instead of a scan.
+from bisect import bisect_right
+from itertools import accumulate
+
+class VirtualListFrame(CTkScrollableFrame):
+    def __init__(self, master, count, create_row, render_row, row_height=30, height=300, **kwargs):
+        super().__init__(master, height=height, **kwargs)
+        self.create_row = create_row        # create_row(parent) -> new row widget
+        self.render_row = render_row        # render_row(widget, index) -> show data[index] in widget
+        self.row_height = row_height        # int, or a function index -> height
+        self._offset = 0                    # scroll position in pixels
+        self._viewport_height = height
+        self._visible = {}                  # index -> row widget currently on screen
+        self._free = []                     # recycled row widgets
+
+        # rows are placed inside a fixed-height viewport, so the inner canvas never scrolls itself;
+        # CTkScrollableFrame keeps its canvas and scrollbar in _parent_canvas and _scrollbar
+        self._viewport = CTkFrame(self, height=height, corner_radius=0, fg_color="transparent")
+        self._viewport.pack(fill="both", expand=True)
+        self._parent_canvas.configure(yscrollcommand=lambda *args: None)
+        self._parent_canvas.bind("<Configure>", self._on_resize, add="+")
+        self._scrollbar.configure(command=self._on_scrollbar)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._viewport.bind(sequence, self._on_wheel)
+        self.set_count(count)
+
+    def set_count(self, count):
+        """ (re)build the cached height index, e.g. after the data source changed size """
+        self.count = count
+        if callable(self.row_height):
+            self._offsets = [0, *accumulate(self.row_height(i) for i in range(count))]
+        else:
+            self._offsets = None
+        for widget in self._visible.values():
+            widget.place_forget()
+            self._free.append(widget)
+        self._visible.clear()
+        self.refresh()
+
+    def _top(self, index):
+        return self._offsets[index] if self._offsets else index * self.row_height
+
+    def _index_at(self, y):
+        if self._offsets:
+            return bisect_right(self._offsets, y) - 1
+        return int(y // self.row_height)
+
+    def _total_height(self):
+        return self._top(self.count)
+
+    def scroll_to(self, offset):
+        self._offset = max(0, min(offset, self._total_height() - self._viewport_height))
+        self.refresh()
+
+    def refresh(self):
+        top, bottom = self._offset, self._offset + self._viewport_height
+        first = self._index_at(top) if self.count else 0
+        last = min(self.count, self._index_at(bottom) + 1)
+        # recycle rows that scrolled out of view, then bind the free ones to the new indices
+        for index in [i for i in self._visible if not first <= i < last]:
+            widget = self._visible.pop(index)
+            widget.place_forget()
+            self._free.append(widget)
+        for index in range(first, last):
+            widget = self._visible.get(index)
+            if widget is None:
+                widget = self._free.pop() if self._free else self._new_row()
+                self.render_row(widget, index)
+                self._visible[index] = widget
+            widget.place(x=0, y=self._top(index) - top, relwidth=1, height=self._top(index + 1) - self._top(index))
+        total = max(self._total_height(), 1)
+        self._scrollbar.set(top / total, min(1.0, bottom / total))
+
+    def _new_row(self):
+        widget = self.create_row(self._viewport)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_wheel)
+        return widget
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * self._total_height())
+        else:
+            step = self._viewport_height if unit == "pages" else 30
+            self.scroll_to(self._offset + int(amount) * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self._offset - 30)
+        else:
+            self.scroll_to(self._offset + 30)
+
+    def _on_resize(self, event):
+        self._viewport_height = event.height
+        self._viewport.configure(height=event.height)
+        self.scroll_to(self._offset)
+
+data = [f"Row {i+1}" for i in range(50_000)]
+app = CTk()
+virtual_list = VirtualListFrame(app,
+                                count=len(data),
+                                create_row=lambda parent: CTkLabel(parent, anchor="w"),
+                                render_row=lambda widget, index: widget.configure(text=data[index]),
+                                row_height=lambda index: 48 if index % 10 == 0 else 30,   # variable heights
+                                width=300, height=300, label_text="50,000 rows")
+virtual_list.pack(padx=20, pady=20, fill="both", expand=True)
+app.mainloop()
+
+
+# Example 5: Benchmark — plain CTkScrollableFrame vs VirtualListFrame
+# construction time (until the first frame is drawn), average frame time while scrolling and the RSS
+# growth of each run; all virtual runs go first: without psutil the RSS fallback only reports the
+# peak, which would otherwise still contain an earlier plain run
+import os, time
+
+def rss_mb():
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / 2**20
+    except ImportError:
+        import resource   # Unix only, reports the peak instead of the current RSS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def measure(build, scroll):
+    app = CTk()
+    before = rss_mb()
+    start = time.perf_counter()
+    frame = build(app)
+    frame.pack(fill="both", expand=True)
+    app.update()
+    construction = time.perf_counter() - start
+    start = time.perf_counter()
+    for step in range(100):
+        scroll(frame, step / 100)
+        app.update_idletasks()
+    frame_time = (time.perf_counter() - start) / 100
+    memory = rss_mb() - before
+    app.destroy()
+    return construction, frame_time, memory
+
+def plain(rows):
+    def build(app):
+        frame = CTkScrollableFrame(app, height=300)
+        for i in range(rows):
+            CTkLabel(frame, text=f"Row {i+1}").pack()
+        return frame
+    return build, lambda frame, f: frame._parent_canvas.yview_moveto(f)
+
+def virtual(rows):
+    def build(app):
+        return VirtualListFrame(app, rows, lambda parent: CTkLabel(parent, anchor="w"),
+                                lambda widget, index: widget.configure(text=f"Row {index+1}"), height=300)
+    return build, lambda frame, f: frame.scroll_to(f * frame._total_height())
+
+for name, case in (("virtual", virtual), ("plain", plain)):
+    for rows in (1_000, 10_000, 100_000):
+        if name == "plain" and rows > 10_000:
+            print(f"{rows:>7} rows | {name:>7} | skipped (one widget per row does not scale)")
+            continue
+        construction, frame_time, memory = measure(*case(rows))
+        print(f"{rows:>7} rows | {name:>7} | build {construction*1000:8.1f} ms | scroll frame {frame_time*1000:6.2f} ms | RSS +{memory:6.1f} MB")
+
+
+# Example 6: Bulk insertion with layout suspended
+# Every child added with .grid()/.pack() can change the inner frame's size, which triggers a
+# <Configure> event and a scrollregion recomputation of the inner canvas once the event loop runs.
+# bulk_add() turns geometry propagation off while children are added and re-enables it at the
+# end, so the frame is measured and the scrollregion updated exactly once.
+import tkinter
+from contextlib import contextmanager
+
+class BulkScrollableFrame(CTkScrollableFrame):
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.layout_passes = 0
+        self._suspended = False
+        # replaces CTkScrollableFrame's own <Configure> handler with a counting one
+        self.bind("<Configure>", self._update_scrollregion)
+
+    def _update_scrollregion(self, event=None):
+        if self._suspended:
+            return
+        self.layout_passes += 1
+        self._parent_canvas.configure(scrollregion=self._parent_canvas.bbox("all"))
+
+    @contextmanager
+    def bulk_add(self):
+        # CTkScrollableFrame.grid_propagate() targets the outer frame, so call tkinter's directly
+        self._suspended = True
+        tkinter.Frame.grid_propagate(self, False)
+        tkinter.Frame.pack_propagate(self, False)
+        try:
+            yield self
+        finally:
+            tkinter.Frame.grid_propagate(self, True)
+            tkinter.Frame.pack_propagate(self, True)
+            self.update_idletasks()   # one geometry pass for all new children
+            self._suspended = False
+            self._update_scrollregion()
+
+class MyBulkFrame(BulkScrollableFrame):
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.label = CTkLabel(self, text="Inside Scrollable Frame")
+        self.label.grid(row=0, column=0, padx=20, pady=10)
+
+        # add many widgets at once: one relayout at the end instead of one per child
+        with self.bulk_add():
+            for i in range(1000):
+                btn = CTkButton(self, text=f"Button {i+1}")
+                btn.grid(row=i+1, column=0, padx=20, pady=5)
+
+app = CTk()
+bulk_frame = MyBulkFrame(master=app, width=300, height=250, label_text="1,000 Buttons")
+bulk_frame.pack(padx=20, pady=20)
+app.mainloop()
+
+
+# Example 7: Measuring layout passes for 1,000 children
+# "one by one" processes pending events after each child, like a loader running from after();
+# "bulk_add" adds the same children inside the context manager.
+def add_children(frame, bulk):
+    app = frame.winfo_toplevel()
+    start = time.perf_counter()
+    if bulk:
+        with frame.bulk_add():
+            for i in range(1000):
+                CTkLabel(frame, text=f"Child {i+1}").grid(row=i, column=0)
+                app.update_idletasks()
+    else:
+        for i in range(1000):
+            CTkLabel(frame, text=f"Child {i+1}").grid(row=i, column=0)
+            app.update_idletasks()
+    app.update()
+    return time.perf_counter() - start
+
+for bulk in (False, True):
+    app = CTk()
+    frame = BulkScrollableFrame(app, width=300, height=250)
+    frame.pack(fill="both", expand=True)
+    app.update()
+    frame.layout_passes = 0
+    elapsed = add_children(frame, bulk)
+    print(f"{'bulk_add' if bulk else 'one by one':>10}: {frame.layout_passes:4d} layout passes | {elapsed*1000:8.1f} ms")
+    app.destroy()
+
+
 
 """
     usage notes:
@@ -101,4 +352,8 @@ FullApp().mainloop()
         ->  You can subclass  CTkScrollableFrame  to create reusable layouts.
         ->  Use  corner_radius=0, fg_color="transparent"  to blend with parent background.
         ->  Combine with  .grid(sticky="nsew")  and parent’s  grid_rowconfigure  for full-window filling.
+        ->  For thousands of rows, don't create one widget per row: virtualize the list (Example 4)
+            so only the visible rows exist and are re-bound to the data while scrolling.
+        ->  When adding many children at once, suspend geometry propagation (Example 6) so the
+            inner canvas is relaid out and its scrollregion recomputed only once.
 """
@@ -35,6 +35,10 @@ usage notes:
 -> Best used with CTkTextbox, CTkCanvas, CTkScrollableFrame, or any widget supporting yview/xview.
 -> You can disable hover effects for static UI by setting hover=False.
 -> Customize colors and radius for better theme consistency.
+-> For canvases with a very large number of items, only materialize the items in the viewport
+   and recycle their canvas IDs while scrolling (Example 4).
+-> For smooth wheel scrolling, accumulate wheel deltas and ease the view once per frame, updating
+   the scrollbar at most once per frame as well (Example 6).
 
 """
 
@@ -104,3 +108,324 @@ for i in range(50):
     text_widget.insert("end", f"Line {i+1}\n")
 
 app.mainloop()
+
+
+# Example 4: Tiled canvas layer for huge scenes (only what is on screen exists on the canvas)
+# Example 2 creates every canvas item up front. With 200k items Tk has to keep, hit-test and redraw
+# all of them. TiledCanvasLayer keeps the items as plain data instead:
+#   - a grid spatial index (tile → item indices) over the logical items
+#   - on every view change (scrollbar, mouse wheel, resize) only the tiles intersecting the
+#     viewport are materialized as canvas items; tiles that leave the view are hidden with one
+#     tag call each, and their canvas item IDs are recycled for the tiles that come into view
+#   - view changes are coalesced: one refresh per idle cycle, however many scroll events arrived
+import time
+from array import array
+from collections import deque
+
+class TiledCanvasLayer:
+    def __init__(self, canvas, tile_size=256, margin=64, label=None, fill="white", font=None):
+        """ label: optional callable(index) → text, so huge scenes don't have to store their strings """
+        self.canvas = canvas
+        self.tile_size = tile_size
+        self.margin = margin            # extra px around the viewport (text extends beyond its anchor)
+        self.label = label
+        self.fill = fill
+        self.font = font or ("Helvetica", 10)
+        self._xs, self._ys = array("d"), array("d")
+        self._texts = []
+        self._tiles = {}                # (tile x, tile y) → [item index, ...]
+        self._live = {}                 # materialized tile → [canvas item id, ...]
+        self._free = []                 # hidden canvas items waiting to be reused
+        self._job = None
+        self.frame_ms = deque(maxlen=240)
+        self.stats = {"created": 0, "reused": 0, "refreshes": 0}
+        canvas.bind("<Configure>", lambda e: self.schedule_refresh(), add="+")
+
+    def __len__(self):
+        return len(self._xs)
+
+    def add(self, x, y, text=None):
+        index = len(self._xs)
+        self._xs.append(x)
+        self._ys.append(y)
+        if self.label is None:
+            self._texts.append(text)
+        self._tiles.setdefault((int(x // self.tile_size), int(y // self.tile_size)), []).append(index)
+        return index
+
+    def connect(self, xscrollbar=None, yscrollbar=None):
+        """ wire CTkScrollbars to the canvas; every view change also refreshes the layer """
+        if xscrollbar is not None:
+            xscrollbar.configure(command=self.canvas.xview)
+            self.canvas.configure(xscrollcommand=lambda *args: (xscrollbar.set(*args), self.schedule_refresh()))
+        if yscrollbar is not None:
+            yscrollbar.configure(command=self.canvas.yview)
+            self.canvas.configure(yscrollcommand=lambda *args: (yscrollbar.set(*args), self.schedule_refresh()))
+
+    def schedule_refresh(self):
+        if self._job is None:
+            self._job = self.canvas.after_idle(self.refresh)
+
+    def refresh(self):
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+        start = time.perf_counter()
+        canvas, size, margin = self.canvas, self.tile_size, self.margin
+        x0, y0 = canvas.canvasx(0) - margin, canvas.canvasy(0) - margin
+        x1, y1 = x0 + canvas.winfo_width() + 2 * margin, y0 + canvas.winfo_height() + 2 * margin
+        wanted = {(tx, ty) for tx in range(int(x0 // size), int(x1 // size) + 1)
+                  for ty in range(int(y0 // size), int(y1 // size) + 1) if (tx, ty) in self._tiles}
+        for tile in self._live.keys() - wanted:
+            tag = f"tile{tile[0]}_{tile[1]}"
+            canvas.itemconfigure(tag, state="hidden")
+            canvas.dtag(tag, tag)
+            self._free += self._live.pop(tile)
+        for tile in wanted - self._live.keys():
+            self._live[tile] = self._materialize(tile)
+        # don't hoard hidden items: keep at most as many as are currently shown
+        excess = len(self._free) - sum(map(len, self._live.values()))
+        if excess > 0:
+            canvas.delete(*self._free[-excess:])
+            del self._free[-excess:]
+        self.stats["refreshes"] += 1
+        self.frame_ms.append((time.perf_counter() - start) * 1000)
+
+    def _materialize(self, tile):
+        canvas, tag, ids = self.canvas, f"tile{tile[0]}_{tile[1]}", []
+        for index in self._tiles[tile]:
+            x, y = self._xs[index], self._ys[index]
+            text = self.label(index) if self.label is not None else self._texts[index]
+            if self._free:
+                item = self._free.pop()
+                canvas.coords(item, x, y)
+                canvas.itemconfigure(item, text=text, state="normal", tags=(tag,))
+                self.stats["reused"] += 1
+            else:
+                item = canvas.create_text(x, y, text=text, fill=self.fill, font=self.font, tags=(tag,))
+                self.stats["created"] += 1
+            ids.append(item)
+        return ids
+
+    def live_items(self):
+        return sum(map(len, self._live.values()))
+
+import random
+
+app = CTk()
+app.geometry("800x600")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+WORLD = 40_000
+map_canvas = CTkCanvas(app, scrollregion=(0, 0, WORLD, WORLD), background="#2b2b2b", highlightthickness=0)
+map_canvas.grid(row=0, column=0, sticky="nsew")
+map_y = CTkScrollbar(app)
+map_y.grid(row=0, column=1, sticky="ns")
+map_x = CTkScrollbar(app, orientation="horizontal")
+map_x.grid(row=1, column=0, sticky="ew")
+layer = TiledCanvasLayer(map_canvas, label=lambda i: f"P{i}")
+for i in range(200_000):
+    layer.add(random.uniform(0, WORLD), random.uniform(0, WORLD))
+layer.connect(map_x, map_y)
+app.mainloop()
+print(f"{len(layer)} logical items, {layer.live_items()} on the canvas, {layer.stats}")
+
+
+# Example 5: Benchmark — scrolling frame time at 10k / 100k / 1M logical items
+# Item density is constant (one item per 40x40 px), so the scene grows with the item count.
+# "eager" creates every item on the canvas like Example 2 (skipped for 1M: it takes too long).
+def scroll_frames(app, canvas, refresh, world, steps=120, pixels_per_frame=20):
+    times = []
+    for k in range(steps):
+        start = time.perf_counter()
+        canvas.xview_moveto(k * pixels_per_frame / world)
+        canvas.yview_moveto(k * pixels_per_frame / world)
+        refresh()
+        app.update_idletasks()      # includes the canvas redraw
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times[len(times) // 2], times[int(len(times) * 0.95)]
+
+for count in (10_000, 100_000, 1_000_000):
+    world = int((count * 40 * 40) ** 0.5)
+    points = [(random.uniform(0, world), random.uniform(0, world)) for _ in range(count)]
+    results = {}
+    for mode in ("eager", "tiled"):
+        if mode == "eager" and count > 100_000:
+            continue
+        app = CTk()
+        app.geometry("800x600")
+        canvas = CTkCanvas(app, scrollregion=(0, 0, world, world), highlightthickness=0)
+        canvas.pack(fill="both", expand=True)
+        app.update()
+        start = time.perf_counter()
+        if mode == "eager":
+            for i, (x, y) in enumerate(points):
+                canvas.create_text(x, y, text=f"P{i}", fill="white", font=("Helvetica", 10))
+            refresh = lambda: None
+        else:
+            bench_layer = TiledCanvasLayer(canvas, label=lambda i: f"P{i}")
+            for x, y in points:
+                bench_layer.add(x, y)
+            refresh = bench_layer.refresh
+        build = (time.perf_counter() - start) * 1000
+        results[mode] = (build, *scroll_frames(app, canvas, refresh, world))
+        app.destroy()
+    for mode, (build, median, p95) in results.items():
+        print(f"{count:>9} items | {mode:<5} | build {build:8.0f} ms | frame median {median:6.2f} ms | p95 {p95:6.2f} ms")
+
+
+# Example 6: Kinetic scroll engine shared by CTkTextbox, CTkScrollableFrame and CTkCanvas
+# With command=widget.yview / yscrollcommand=scrollbar.set every wheel event is one synchronous
+# view jump plus one scrollbar redraw. KineticScroller sits in between:
+#   - wheel / trackpad deltas are accumulated into a target position
+#   - the view glides to the target with exponential easing, one yview_moveto per display frame,
+#     in pixel steps (independent of the frame rate: late frames take bigger steps)
+#   - the scrollbar thumb is updated at most once per frame, however often the view reports back
+#   - dragging the scrollbar stays direct; the next wheel input continues from wherever the view is
+#   - stats() reports wheel events, frames, thumb updates and frame work / interval times
+# attach_textbox(), attach_scrollable_frame() and attach_view() connect it to the three widget kinds.
+import math, sys
+
+class KineticScroller:
+    def __init__(self, view, scrollbar=None, axis="y", fps=60, duration_ms=150, wheel_px=60):
+        """ view: the tkinter widget that scrolls (tkinter.Text, CTkCanvas); scrollbar: CTkScrollbar """
+        self.view = view
+        self.scrollbar = scrollbar
+        self.axis = axis
+        self._view = getattr(view, f"{axis}view")
+        self._moveto = getattr(view, f"{axis}view_moveto")
+        self.frame_ms = max(1, round(1000 / fps))
+        self.tau = duration_ms / 3000   # time constant: ~95% of the way after duration_ms
+        self.wheel_px = wheel_px
+        self._position = self._target = 0.0
+        self._fraction_per_px = 0.0
+        self._tick_job = self._thumb_job = None
+        self._thumb = None
+        self._last_tick = 0.0
+        self.frame_ms_work = deque(maxlen=240)
+        self.frame_ms_interval = deque(maxlen=240)
+        self.counts = {"wheel_events": 0, "frames": 0, "view_reports": 0, "thumb_updates": 0}
+        if scrollbar is not None:
+            view.configure(**{f"{axis}scrollcommand": self._on_view_report})
+
+    # --- input ---
+    def on_wheel(self, event):
+        """ bind to <MouseWheel> / <Button-4> / <Button-5>; returns "break" so the default jump is skipped """
+        if event.num in (4, 5):                 # X11
+            pixels = -self.wheel_px if event.num == 4 else self.wheel_px
+        elif sys.platform == "darwin":          # delta counts lines (small values from trackpads)
+            pixels = -event.delta * self.wheel_px / 3
+        else:                                   # Windows: 120 per notch
+            pixels = -event.delta * self.wheel_px / 120
+        self.scroll_by(pixels)
+        return "break"
+
+    def scroll_by(self, pixels):
+        self.counts["wheel_events"] += 1
+        first, last = self._view()
+        size = self.view.winfo_height() if self.axis == "y" else self.view.winfo_width()
+        if last - first >= 1.0 or size <= 1:
+            return
+        self._fraction_per_px = (last - first) / size
+        if self._tick_job is None:              # start from the actual view (it may have been dragged)
+            self._position = self._target = first
+            self._last_tick = time.perf_counter()
+            self._tick_job = self.view.after(self.frame_ms, self._tick)
+        self._target = min(max(self._target + pixels * self._fraction_per_px, 0.0), 1.0 - (last - first))
+
+    # --- animation ---
+    def _tick(self):
+        now = time.perf_counter()
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        self.frame_ms_interval.append(elapsed * 1000)
+        self._position += (self._target - self._position) * (1 - math.exp(-elapsed / self.tau))
+        settled = abs(self._target - self._position) < 0.5 * self._fraction_per_px
+        if settled:
+            self._position = self._target
+        self._moveto(self._position)
+        self.counts["frames"] += 1
+        self.frame_ms_work.append((time.perf_counter() - now) * 1000)
+        self._tick_job = None if settled else self.view.after(self.frame_ms, self._tick)
+
+    # --- scrollbar ---
+    def _on_view_report(self, first, last):
+        self.counts["view_reports"] += 1
+        self._thumb = (first, last)
+        if self._thumb_job is None:
+            self._thumb_job = self.view.after(self.frame_ms, self._update_thumb)
+
+    def _update_thumb(self):
+        self._thumb_job = None
+        self.scrollbar.set(*self._thumb)
+        self.counts["thumb_updates"] += 1
+
+    def stats(self):
+        work, interval = sorted(self.frame_ms_work), sorted(self.frame_ms_interval)
+        return {**self.counts,
+                "frame_work_ms_p95": work[int(len(work) * 0.95)] if work else 0.0,
+                "frame_interval_ms_p95": interval[int(len(interval) * 0.95)] if interval else 0.0,
+                "frame_interval_ms_max": interval[-1] if interval else 0.0}
+
+def attach_view(view, scrollbar, axis="y", **kwargs):
+    """ plain tkinter.Text / CTkCanvas + CTkScrollbar (Example 1 and 2 style) """
+    scroller = KineticScroller(view, scrollbar, axis=axis, **kwargs)
+    scrollbar.configure(command=getattr(view, f"{axis}view"))
+    for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        view.bind(sequence, scroller.on_wheel)
+    return scroller
+
+def attach_textbox(textbox, **kwargs):
+    """ CTkTextbox with its built-in scrollbar (activate_scrollbars=True) """
+    return attach_view(textbox._textbox, textbox._y_scrollbar, **kwargs)
+
+def attach_scrollable_frame(frame, **kwargs):
+    """ CTkScrollableFrame: its own wheel handler asks the canvas to scroll by "units";
+        those requests are redirected into the scroller, converted to pixels """
+    canvas, axis = frame._parent_canvas, "x" if frame._orientation == "horizontal" else "y"
+    unit_px = int(float(canvas.cget(f"{axis}scrollincrement"))) or 30
+    canvas.configure(**{f"{axis}scrollincrement": 1})     # otherwise moveto snaps to whole units
+    scroller = KineticScroller(canvas, frame._scrollbar, axis=axis, **kwargs)
+    view, view_scroll = getattr(canvas, f"{axis}view"), getattr(canvas, f"{axis}view_scroll")
+
+    def scroll_request(*args):
+        if args and args[0] == "scroll" and args[2] == "units":
+            return scroller.scroll_by(int(args[1]) * unit_px)
+        return view(*args)
+
+    setattr(canvas, f"{axis}view", scroll_request)
+    setattr(canvas, f"{axis}view_scroll", lambda number, what: scroll_request("scroll", number, what)
+            if what == "units" else view_scroll(number, what))
+    return scroller
+
+app = CTk()
+app.geometry("900x450")
+for column in range(3):
+    app.grid_columnconfigure(column, weight=1)
+app.grid_rowconfigure(0, weight=1)
+
+kinetic_textbox = CTkTextbox(app)
+kinetic_textbox.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+kinetic_textbox.insert("0.0", "".join(f"Line {i}\n" for i in range(5000)))
+
+kinetic_frame = CTkScrollableFrame(app)
+kinetic_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
+for i in range(300):
+    CTkLabel(kinetic_frame, text=f"Row {i}").pack(anchor="w")
+
+canvas_box = CTkFrame(app)
+canvas_box.grid(row=0, column=2, sticky="nsew", padx=5, pady=5)
+kinetic_canvas = CTkCanvas(canvas_box, scrollregion=(0, 0, 300, 20000), background="#2b2b2b", highlightthickness=0)
+kinetic_canvas.pack(side="left", fill="both", expand=True)
+canvas_scrollbar = CTkScrollbar(canvas_box)
+canvas_scrollbar.pack(side="right", fill="y")
+for i in range(1000):
+    kinetic_canvas.create_text(20, 10 + i * 20, text=f"Item {i}", fill="white", anchor="w")
+
+scrollers = {"textbox": attach_textbox(kinetic_textbox),
+             "scrollable frame": attach_scrollable_frame(kinetic_frame),
+             "canvas": attach_view(kinetic_canvas, canvas_scrollbar)}
+app.mainloop()
+for name, scroller in scrollers.items():
+    print(f"{name:<17} {scroller.stats()}")
@@ -114,6 +114,387 @@ seg.set("X")         # Select "X"
 app.mainloop()
 
 
+# Example 5: Segmented button for hundreds of segments (overflow + cheap insert/move/delete)
+# CTkSegmentedButton keeps one CTkButton per value in a grid: every insert/move/delete re-grids all
+# buttons (move even destroys and recreates its button), each button measures its own text, and with
+# 100+ values the control grows wider than the window. ScalableSegmentedButton:
+#   - keeps the segments as an indexed model (values + cached widths + x offsets); an edit changes
+#     the lists and marks the offsets stale from the edited index on, no widget is touched
+#   - measures each text once per font (TextWidths is shared by every button of a window using that
+#     font); a CTkFont is followed through font.configure(...), a font tuple is changed with configure(font=...)
+#   - only creates buttons for the segments that are visible, reused from a pool, and lays them out
+#     with place() once per idle callback, however many edits happened before it
+#   - overflow="scroll": ‹ › buttons and the mouse wheel scroll the row, set() scrolls the selected
+#     segment into view; overflow="menu": segments that do not fit go into a » dropdown
+#   - horizontal orientation only; `width` is the visible width (pack/grid with fill to follow the window)
+import bisect, time, tkinter, tkinter.font
+from customtkinter.windows.widgets.core_widget_classes import DropdownMenu
+
+class TextWidths:
+    """ text widths in px (unscaled), measured once per font and text """
+
+    def __init__(self, tk_font):
+        self._font = tk_font
+        self._widths = {}
+        self.measured = 0
+
+    @classmethod
+    def for_font(cls, widget, font):
+        if isinstance(font, CTkFont):
+            key = tuple(sorted(font.actual().items()))
+            description = dict(key)
+        else:
+            key = tuple(font)
+            description = {"font": (font[0], -abs(font[1])) + tuple(font[2:])}   # px, like CTkFont
+        # one cache per window: the tkinter font belongs to the Tk app of the widget that created it
+        toplevel = widget.winfo_toplevel()
+        shared = getattr(toplevel, "_text_widths", None)
+        if shared is None:
+            shared = toplevel._text_widths = {}     # font description → TextWidths
+        widths = shared.get(key)
+        if widths is None:
+            widths = shared[key] = cls(tkinter.font.Font(root=widget, **description))
+        return widths
+
+    def width(self, text):
+        width = self._widths.get(text)
+        if width is None:
+            width = self._widths[text] = self._font.measure(text)
+            self.measured += 1
+        return width
+
+class ScalableSegmentedButton(CTkSegmentedButton):
+    SIDE_BUTTON_WIDTH = 24      # ‹ › and »
+
+    def __init__(self, master, values=None, overflow="scroll", variable=None, **kwargs):
+        if overflow not in ("scroll", "menu"):
+            raise ValueError(f"overflow must be 'scroll' or 'menu', not '{overflow}'")
+        if kwargs.get("orientation", "horizontal") != "horizontal":
+            raise ValueError("ScalableSegmentedButton only supports orientation='horizontal'")
+        self._overflow = overflow
+        self._value_set = set()
+        self._widths = []           # segment width per index
+        self._starts = []           # x offset per index, valid up to _dirty_from
+        self._dirty_from = None
+        self._offset = 0            # scroll position in px
+        self._visible_end = 0       # first index that is not shown
+        self._pool = []             # unused buttons
+        self._button_values = {}    # button → value it shows
+        self._roles = {}            # button → corner role ("only", "first", "last", "middle")
+        self._layout_job = None
+        self._menu = None
+        super().__init__(master, values=[], **kwargs)
+        self._text_widths = TextWidths.for_font(self, self._font)
+        self._padding = self._segment_padding()
+        self._watch_font(self._font)
+        self._left = CTkButton(self, text="‹", command=lambda: self.scroll(-self._current_width // 2),
+                               **self._side_button_style())
+        self._right = CTkButton(self, text="›", command=lambda: self.scroll(self._current_width // 2),
+                                **self._side_button_style())
+        self._more = CTkButton(self, text="»", command=self._open_overflow_menu, **self._side_button_style())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            CTkFrame.bind(self, sequence, self._on_mouse_wheel)    # CTkSegmentedButton.bind is disabled
+        if values:
+            self.configure(values=values)
+        if variable is not None:
+            self.configure(variable=variable)
+
+    def _side_button_style(self):
+        return dict(width=self.SIDE_BUTTON_WIDTH, height=self._current_height,
+                    corner_radius=self._sb_corner_radius, border_width=self._sb_border_width,
+                    fg_color=self._sb_unselected_color, border_color=self._sb_fg_color,
+                    hover_color=self._sb_unselected_hover_color, text_color=self._sb_text_color,
+                    text_color_disabled=self._sb_text_color_disabled, font=self._font, state=self._state)
+
+    def _watch_font(self, font, watch=True):
+        if isinstance(font, CTkFont):
+            if watch:
+                font.add_size_configure_callback(self._remeasure)
+            else:
+                font.remove_size_configure_callback(self._remeasure)
+
+    def _remeasure(self):
+        self._text_widths = TextWidths.for_font(self, self._font)
+        self._padding = self._segment_padding()
+        self._widths = [self._text_widths.width(value) + self._padding for value in self._value_list]
+        for value in list(self._buttons_dict):      # re-realized with the new widths
+            self._release(value)
+        self._mark(0)
+
+    def _segment_padding(self):
+        return 2 * (max(self._sb_corner_radius, self._sb_border_width + 1, 2) + 6)
+
+    # --- model: only lists change, the layout catches up on idle ---
+    def _mark(self, index):
+        self._dirty_from = index if self._dirty_from is None else min(self._dirty_from, index)
+        self._schedule_layout()
+
+    def _update_starts(self):
+        if self._dirty_from is None:
+            return
+        index = min(self._dirty_from, len(self._widths))
+        del self._starts[index:]
+        x = self._starts[-1] + self._widths[index - 1] if index else 0
+        for width in self._widths[index:]:
+            self._starts.append(x)
+            x += width
+        self._dirty_from = None
+
+    def insert(self, index, value):
+        if value == "":
+            raise ValueError(f"CTkSegmentedButton can not insert value ''")
+        if value in self._value_set:
+            raise ValueError(f"CTkSegmentedButton can not insert value '{value}', already part of the values")
+        if index < 0:
+            index = max(len(self._value_list) + index, 0)
+        index = min(index, len(self._value_list))
+        self._value_list.insert(index, value)
+        self._widths.insert(index, self._text_widths.width(value) + self._padding)
+        self._value_set.add(value)
+        self._mark(index)
+
+    def delete(self, value):
+        if value not in self._value_set:
+            raise ValueError(f"CTkSegmentedButton does not contain value '{value}'")
+        index = self._value_list.index(value)
+        del self._value_list[index]
+        del self._widths[index]
+        self._value_set.discard(value)
+        if value in self._buttons_dict:
+            self._release(value)
+        self._mark(index)
+
+    def move(self, new_index, value):
+        if not 0 <= new_index < len(self._value_list):
+            raise ValueError(f"CTkSegmentedButton new_index {new_index} not in range of value list with len {len(self._value_list)}")
+        if value not in self._value_set:
+            raise ValueError(f"CTkSegmentedButton has no value named '{value}'")
+        index = self._value_list.index(value)
+        width = self._widths.pop(index)
+        self._value_list.pop(index)
+        self._value_list.insert(new_index, value)
+        self._widths.insert(new_index, width)
+        self._mark(min(index, new_index))
+
+    def configure(self, **kwargs):
+        if "values" in kwargs:
+            values = list(kwargs.pop("values"))
+            self._check_unique_values(values)
+            for value in list(self._buttons_dict):
+                self._release(value)
+            self._value_list = values
+            self._value_set = set(values)
+            self._widths = [self._text_widths.width(value) + self._padding for value in values]
+            self._mark(0)
+        restyle = kwargs.keys() - {"command", "variable", "dynamic_resizing", "width"}
+        remeasure = kwargs.keys() & {"font", "corner_radius", "border_width"}
+        if "font" in kwargs:
+            self._watch_font(self._font, watch=False)
+        super().configure(**kwargs)
+        if "font" in kwargs:
+            self._watch_font(self._font)
+        if restyle:         # shown buttons were updated by CTkSegmentedButton, pooled ones are dropped
+            self._drop_pool()
+            for button in (self._left, self._right, self._more):
+                button.configure(**self._side_button_style())
+            self._schedule_layout()     # » gets its selection color back
+        if remeasure:
+            self._remeasure()
+
+    def set(self, value, from_variable_callback=False, from_button_callback=False):
+        super().set(value, from_variable_callback, from_button_callback)
+        if value in self._value_set:
+            self.see(value)
+
+    def see(self, value):
+        """ scroll so that the segment of value is fully visible """
+        if self._overflow != "scroll":
+            self._schedule_layout()     # » is highlighted when it holds the selection
+            return
+        self._update_starts()
+        index = self._value_list.index(value)
+        start, end = self._starts[index], self._starts[index] + self._widths[index]
+        visible = self._current_width - 2 * self.SIDE_BUTTON_WIDTH
+        if start < self._offset:
+            self._offset = start
+        elif end > self._offset + visible:
+            self._offset = end - visible
+        self._schedule_layout()
+
+    def scroll(self, px):
+        self._offset += px
+        self._schedule_layout()
+
+    def _on_mouse_wheel(self, event):
+        if self._overflow == "scroll" and self._state != "disabled":
+            self.scroll(-60 if event.num == 4 or event.delta > 0 else 60)
+
+    # --- widgets: only for visible segments ---
+    def _configure_button_corners_for_index(self, index):
+        self._roles.clear()         # corners follow the visible row, reassigned by _layout()
+        self._schedule_layout()
+
+    def _select_button_by_value(self, value):
+        self._unselect_button_by_value(self._current_value)
+        self._current_value = value
+        if value in self._buttons_dict:
+            self._buttons_dict[value].configure(fg_color=self._sb_selected_color,
+                                                hover_color=self._sb_selected_hover_color)
+        self._schedule_layout()
+
+    def _create_button_grid(self):
+        self._schedule_layout()
+
+    def _set_dimensions(self, width=None, height=None):
+        super()._set_dimensions(width, height)
+        for button in (self._left, self._right, self._more):
+            button.configure(height=height)
+        self._drop_pool()
+        self._schedule_layout()
+
+    def _update_dimensions_event(self, event):
+        super()._update_dimensions_event(event)
+        self._schedule_layout()
+
+    def _realize(self, value, index):
+        if self._pool:
+            button = self._pool.pop()
+        else:
+            button = self._create_button(index, value)
+            button.configure(command=lambda b=button: self.set(self._button_values[b], from_button_callback=True))
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                button.bind(sequence, self._on_mouse_wheel)
+        selected = value == self._current_value
+        button.configure(text=value, width=self._widths[index],
+                         fg_color=self._sb_selected_color if selected else self._sb_unselected_color,
+                         hover_color=self._sb_selected_hover_color if selected else self._sb_unselected_hover_color)
+        self._button_values[button] = value
+        self._buttons_dict[value] = button
+        return button
+
+    def _release(self, value):
+        button = self._buttons_dict.pop(value)
+        button.place_forget()
+        self._pool.append(button)
+
+    def _drop_pool(self):
+        for button in self._pool:
+            self._button_values.pop(button, None)
+            self._roles.pop(button, None)
+            button.destroy()
+        self._pool.clear()
+
+    def _corner_colors(self, role):
+        bg, fg = self._bg_color, self._sb_fg_color
+        return {"only": (bg, bg, bg, bg), "first": (bg, fg, fg, bg),
+                "last": (fg, bg, bg, fg), "middle": (fg, fg, fg, fg)}[role]
+
+    def _schedule_layout(self):
+        if self._layout_job is None:
+            self._layout_job = self.after_idle(self._layout)
+
+    def _layout(self):
+        self._layout_job = None
+        self._update_starts()
+        count = len(self._value_list)
+        view = self._current_width
+        total = self._starts[-1] + self._widths[-1] if count else 0
+        first, end = 0, count
+        if total <= view:
+            self._offset = 0
+        elif self._overflow == "scroll":
+            visible = view - 2 * self.SIDE_BUTTON_WIDTH
+            self._offset = max(0, min(self._offset, total - visible))
+            first = max(bisect.bisect_right(self._starts, self._offset) - 1, 0)
+            end = bisect.bisect_left(self._starts, self._offset + visible)
+        else:
+            self._offset = 0
+            visible = view - self.SIDE_BUTTON_WIDTH
+            end = bisect.bisect_right(self._starts, visible)
+            while end and self._starts[end - 1] + self._widths[end - 1] > visible:
+                end -= 1
+        self._visible_end = end
+
+        shown = self._value_list[first:end]
+        for value in self._buttons_dict.keys() - set(shown):
+            self._release(value)
+        for index, value in enumerate(shown, start=first):
+            button = self._buttons_dict.get(value) or self._realize(value, index)
+            button.place(x=self._starts[index] - self._offset, y=0)
+            role = ("only" if first == end - 1 else "first" if index == first
+                    else "last" if index == end - 1 else "middle")
+            if self._roles.get(button) != role:
+                self._roles[button] = role
+                button.configure(background_corner_colors=self._corner_colors(role))
+
+        for button in (self._left, self._right, self._more):
+            button.place_forget()
+        if total > view and self._overflow == "scroll":
+            self._left.place(x=view - 2 * self.SIDE_BUTTON_WIDTH, y=0)
+            self._right.place(x=view - self.SIDE_BUTTON_WIDTH, y=0)
+            self._left.lift()
+            self._right.lift()
+        elif total > view:
+            holds_selection = self._current_value in self._value_set and self._current_value not in self._buttons_dict
+            self._more.configure(fg_color=self._sb_selected_color if holds_selection else self._sb_unselected_color)
+            self._more.place(x=view - self.SIDE_BUTTON_WIDTH, y=0)
+            self._more.lift()
+
+    def _open_overflow_menu(self):
+        hidden = self._value_list[self._visible_end:]
+        if self._menu is None:
+            self._menu = DropdownMenu(master=self, values=hidden, font=self._font,
+                                      command=lambda value: self.set(value, from_button_callback=True))
+        else:
+            self._menu.configure(values=hidden)
+        self._menu.open(self._more.winfo_rootx(), self._more.winfo_rooty() + self._more.winfo_height())
+
+    def destroy(self):
+        if self._layout_job is not None:
+            self.after_cancel(self._layout_job)
+        self._watch_font(self._font, watch=False)
+        super().destroy()
+
+app = CTk()
+app.geometry("700x160")
+tabs = ScalableSegmentedButton(app, values=[f"Sheet {i}" for i in range(1, 301)], command=segmented_callback)
+tabs.pack(padx=20, pady=10, fill="x")
+tabs.set("Sheet 150")       # scrolled into view
+menu_tabs = ScalableSegmentedButton(app, values=[f"Item {i}" for i in range(1, 101)], overflow="menu")
+menu_tabs.pack(padx=20, pady=10, fill="x")
+CTkButton(app, text="Insert at front", command=lambda: tabs.insert(0, f"New {time.monotonic():.3f}")).pack(pady=5)
+app.mainloop()
+
+
+# Example 6: Benchmark — 300 segments, 100 inserts / moves / deletes, each followed by a redraw
+def run_edits(make, count=300, edits=100):
+    app = CTk()
+    app.geometry("800x100")
+    start = time.perf_counter()
+    seg = make(app, [f"Segment {i}" for i in range(count)])
+    seg.pack(fill="x")
+    app.update()
+    timings = {"build": time.perf_counter() - start}
+    for name, edit in (("insert", lambda i: seg.insert(i * 3 % count, f"Extra {i}")),
+                       ("move", lambda i: seg.move(i * 7 % count, f"Segment {i}")),
+                       ("delete", lambda i: seg.delete(f"Extra {i}"))):
+        start = time.perf_counter()
+        for i in range(edits):
+            edit(i)
+            app.update()
+        timings[name] = (time.perf_counter() - start) / edits
+    app.destroy()
+    return timings
+
+results = {
+    "CTkSegmentedButton": run_edits(lambda master, values: CTkSegmentedButton(master, values=values)),
+    "ScalableSegmentedButton": run_edits(lambda master, values: ScalableSegmentedButton(master, values=values)),
+}
+print(f"{'':<26}{'build':>10}{'insert':>10}{'move':>10}{'delete':>10}   (per edit incl. redraw)")
+for name, timings in results.items():
+    print(f"{name:<26}" + "".join(f"{timings[key] * 1000:>7.1f} ms" for key in ("build", "insert", "move", "delete")))
+
+
 """
     usage notes:
         -> Use   .set("Value")   to programmatically select a segment.
@@ -122,4 +503,6 @@ app.mainloop()
         -> You can bind a   StringVar   to sync value changes across widgets.
         -> Customize colors for selected/unselected states to match theme.
         -> Disable interaction with   state="disabled"   when needed.
+        -> With many segments, use a model that only builds buttons for the visible segments and
+           scrolls or collapses the rest into a menu (Example 5).
 """
\ No newline at end of file
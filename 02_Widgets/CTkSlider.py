@@ -97,6 +97,131 @@ step_slider.pack(padx=20, pady=20)
 app.mainloop()
 
 
+# Example 5: Coalesced command delivery while dragging
+# CTkSlider calls command and writes the variable for EVERY motion event of a drag, often hundreds
+# per second, even when number_of_steps keeps the value on the same step. CoalescedSlider:
+#   - still moves the handle on every motion event (without re-coloring all canvas parts)
+#   - ignores positions that round to the value it already has (number_of_steps duplicates)
+#   - delivers command(value) and the variable write at most once per interval_ms (16 ≈ one frame)
+#   - always calls on_settled(value) once when the drag ends (button release), or settle_ms after
+#     the last mouse-wheel step
+import time
+
+class CoalescedSlider(CTkSlider):
+    def __init__(self, master, interval_ms=16, on_settled=None, settle_ms=300, **kwargs):
+        super().__init__(master, **kwargs)
+        self.interval_ms = interval_ms
+        self.on_settled = on_settled
+        self.settle_ms = settle_ms
+        self._pending = self._dragging = False
+        self._flush_job = self._settle_job = None
+        self._last_delivery = 0.0
+        self._delivered_value = self._output_value
+        self.stats = {"events": 0, "duplicates": 0, "delivered": 0, "settled": 0}
+        self._canvas.bind("<Button-1>", self._press, add="+")
+        self._canvas.bind("<ButtonRelease-1>", self._release, add="+")
+
+    def _update_value(self, value):
+        self.stats["events"] += 1
+        value = max(0.0, min(1.0, value))
+        output_value = self._round_to_step_size(self._from_ + value * (self._to - self._from_))
+        if output_value == self._output_value:
+            self.stats["duplicates"] += 1
+            return
+        self._output_value = output_value
+        self._value = (output_value - self._from_) / (self._to - self._from_)
+        self._draw(no_color_updates=True)       # the handle follows the pointer right away
+        self._pending = True
+        if self._flush_job is None:
+            delay = self._last_delivery + self.interval_ms / 1000 - time.perf_counter()
+            self._flush_job = self.after(max(0, int(delay * 1000)), self._flush)
+        if not self._dragging:                  # mouse wheel: settle once the wheel stops
+            if self._settle_job is not None:
+                self.after_cancel(self._settle_job)
+            self._settle_job = self.after(self.settle_ms, self._settle)
+
+    def _flush(self):
+        self._flush_job = None
+        if not self._pending:
+            return
+        self._pending = False
+        self._last_delivery = time.perf_counter()
+        if self._output_value == self._delivered_value:     # dragged back to the delivered value
+            return
+        self._delivered_value = self._output_value
+        if self._variable is not None:
+            self._variable_callback_blocked = True
+            self._variable.set(round(self._output_value) if isinstance(self._variable, IntVar) else self._output_value)
+            self._variable_callback_blocked = False
+        if self._command is not None:
+            self._command(self._output_value)
+        self.stats["delivered"] += 1
+
+    def _press(self, event=None):
+        # runs after CTkSlider's own <Button-1> handler, which already went through _update_value
+        self._dragging = self._state == "normal"
+        if self._dragging and self._settle_job is not None:
+            self.after_cancel(self._settle_job)
+            self._settle_job = None
+
+    def _release(self, event=None):
+        if self._dragging:
+            self._dragging = False
+            self._settle()
+
+    def _settle(self):
+        self._settle_job = None
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        self._flush()
+        self.stats["settled"] += 1
+        if self.on_settled is not None:
+            self.on_settled(self._output_value)
+
+def render_chart(value):        # stands in for re-filtering a chart or re-querying data
+    time.sleep(0.02)
+    preview.configure(text=f"rendered for {value:.1f}")
+
+app = CTk()
+chart_slider = CoalescedSlider(app, from_=0, to=100, command=render_chart,
+                               on_settled=lambda value: print("settled at", value))
+chart_slider.pack(padx=20, pady=20)
+preview = CTkLabel(app, text="")
+preview.pack(padx=20, pady=(0, 20))
+app.mainloop()
+print(chart_slider.stats)
+
+
+# Example 6: Benchmark — 300 motion events in one second, stock vs coalesced
+def simulated_drag(slider_class, events=300, interval_ms=3, **kwargs):
+    app = CTk()
+    calls = []
+    slider = slider_class(app, from_=0, to=100, width=300, command=calls.append, **kwargs)
+    slider.pack(padx=20, pady=20)
+
+    def move(i=0):
+        if i < events:
+            slider._canvas.event_generate("<Button-1>" if i == 0 else "<B1-Motion>", x=int(300 * i / events), y=5)
+            app.after(interval_ms, move, i + 1)
+        else:
+            slider._canvas.event_generate("<ButtonRelease-1>", x=300, y=5)
+            app.after(300, app.quit)
+
+    app.after(200, move)
+    app.mainloop()
+    stats = getattr(slider, "stats", {})
+    app.destroy()
+    return len(calls), stats
+
+for label, slider_class, kwargs in (("CTkSlider", CTkSlider, {}),
+                                     ("CTkSlider, 10 steps", CTkSlider, {"number_of_steps": 10}),
+                                     ("CoalescedSlider", CoalescedSlider, {}),
+                                     ("CoalescedSlider, 10 steps", CoalescedSlider, {"number_of_steps": 10})):
+    calls, stats = simulated_drag(slider_class, **kwargs)
+    print(f"{label:<28} command calls {calls:>4}  {stats}")
+
+
 """
     usage notes:
         -> Use    .set(value)    to programmatically change the slider position.
@@ -105,4 +230,6 @@ app.mainloop()
         -> Customize    progress_color    and    button_color    to match your theme.
         -> Use    orientation="vertical"    for vertical sliders.
         -> Disable interaction with    state="disabled".
+        -> If    command    does expensive work, coalesce drag updates to one per frame and react to
+           the final value in a "settled" callback (Example 5).
 """
@@ -137,6 +137,167 @@ app = App()
 app.mainloop()
 
 
+# Example 5: Lazy tabs with an LRU budget (large settings dialogs)
+# tabview.add(name) returns an empty frame, but the usual pattern fills every tab right away,
+# so a 25-tab dialog builds thousands of widgets before it can appear. LazyTabview:
+#   - add_lazy(name, builder) adds the tab; builder(frame) runs the first time the tab is shown
+#     (click on the segmented button or .set(name)), the initially visible tab is built at once
+#   - max_loaded_widgets (optional) is a budget over the built tabs, counted in Tk widgets; when it
+#     is exceeded, the least recently shown hidden tabs have their contents destroyed and are
+#     rebuilt by the builder when shown again; on_unload(frame) can save their state first
+#   - hidden tabs are only grid_forget()-ed by CTkTabview, so without a budget they stay in memory
+import os, time, tkinter
+from collections import OrderedDict
+
+def count_widgets(widget):
+    """ all Tk widgets below widget, including the canvases CustomTkinter widgets are drawn on """
+    children = tkinter.Misc.winfo_children(widget)
+    return len(children) + sum(count_widgets(child) for child in children)
+
+class LazyTabview(CTkTabview):
+    def __init__(self, master, max_loaded_widgets=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.max_loaded_widgets = max_loaded_widgets
+        self._builders = {}             # name → (builder, on_unload)
+        self._loaded = OrderedDict()    # name → widget count, least recently shown first
+        self.stats = {"builds": 0, "unloads": 0}
+
+    def add_lazy(self, name, builder, on_unload=None):
+        frame = self.add(name)
+        self._builders[name] = (builder, on_unload)
+        if self.get() == name:
+            self._load(name)
+        return frame
+
+    def set(self, name):
+        self._load(name)
+        super().set(name)
+
+    def _segmented_button_callback(self, selected_name):
+        self._load(selected_name)
+        super()._segmented_button_callback(selected_name)
+
+    def delete(self, name):
+        self._builders.pop(name, None)
+        self._loaded.pop(name, None)
+        super().delete(name)
+        if self.get():      # CTkTabview may show the remaining tab without going through set()
+            self._load(self.get())
+
+    def rename(self, old_name, new_name):
+        super().rename(old_name, new_name)
+        if old_name in self._builders:
+            self._builders[new_name] = self._builders.pop(old_name)
+        if old_name in self._loaded:    # same position in the LRU order
+            self._loaded = OrderedDict((new_name if name == old_name else name, count)
+                                       for name, count in self._loaded.items())
+
+    def _load(self, name):
+        if name not in self._builders:      # a regular tab filled by the caller
+            return
+        if name in self._loaded:
+            self._loaded.move_to_end(name)
+        else:
+            frame = self.tab(name)
+            self._builders[name][0](frame)
+            self._loaded[name] = count_widgets(frame)
+            self.stats["builds"] += 1
+        if self.max_loaded_widgets is not None:
+            while sum(self._loaded.values()) > self.max_loaded_widgets and len(self._loaded) > 1:
+                self.unload(next(iter(self._loaded)))   # the shown tab is the most recent, never first
+
+    def unload(self, name):
+        on_unload = self._builders[name][1]
+        frame = self.tab(name)
+        if on_unload is not None:
+            on_unload(frame)
+        for child in frame.winfo_children():
+            child.destroy()
+        del self._loaded[name]
+        self.stats["unloads"] += 1
+
+    def loaded_tabs(self):
+        return list(self._loaded)
+
+# a settings page: 48 label + entry pairs in 3 columns; entry values survive unloading through on_unload
+# (a plain CTkFrame: CTkScrollableFrame installs bind_all handlers that destroy() does not remove,
+# so every unload/rebuild cycle would leak them)
+SETTINGS = 48
+page_entries = {}       # page → its entries while the page is built
+saved_values = {}       # page → entry texts of an unloaded page
+
+def settings_page(page):
+    def build(frame):
+        body = CTkFrame(frame, fg_color="transparent")
+        body.pack(fill="both", expand=True)
+        values = saved_values.pop(page, [""] * SETTINGS)
+        entries = page_entries[page] = []
+        for i in range(SETTINGS):
+            row, column = i % 16, i // 16 * 2
+            CTkLabel(body, text=f"Setting {page}.{i}", height=22).grid(row=row, column=column, sticky="w", padx=5)
+            entry = CTkEntry(body, width=120, height=22)
+            entry.insert(0, values[i])
+            entry.grid(row=row, column=column + 1, padx=5, pady=1)
+            entries.append(entry)
+    return build
+
+def save_page(page):
+    def save(frame):
+        saved_values[page] = [entry.get() for entry in page_entries.pop(page)]
+    return save
+
+app = CTk()
+app.geometry("800x520")
+settings = LazyTabview(app, max_loaded_widgets=3000)
+settings.pack(padx=20, pady=20, fill="both", expand=True)
+for page in range(25):
+    settings.add_lazy(f"P{page}", settings_page(page), on_unload=save_page(page))
+app.mainloop()
+print("loaded:", settings.loaded_tabs(), settings.stats)
+
+
+# Example 6: Benchmark — open time and RSS of a 25-tab dialog, eager vs lazy
+# (the lazy run goes first: without psutil the RSS fallback only reports the peak)
+def rss_mb():
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / 2**20
+    except ImportError:
+        import resource   # Unix only, reports the peak instead of the current RSS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def open_dialog(lazy, tabs=25):
+    app = CTk()
+    app.geometry("800x520")
+    before = rss_mb()
+    start = time.perf_counter()
+    if lazy:
+        dialog = LazyTabview(app, max_loaded_widgets=3000)
+        dialog.pack(fill="both", expand=True)
+        for page in range(tabs):
+            dialog.add_lazy(f"P{page}", settings_page(page))
+    else:
+        dialog = CTkTabview(app)
+        dialog.pack(fill="both", expand=True)
+        for page in range(tabs):
+            settings_page(page)(dialog.add(f"P{page}"))
+    app.update()
+    opened = (time.perf_counter() - start) * 1000
+    opened_rss = rss_mb() - before
+    for page in range(tabs):       # the user clicks through every tab
+        dialog.set(f"P{page}")
+        app.update()
+    visited_rss = rss_mb() - before
+    widgets = count_widgets(dialog)
+    app.destroy()
+    return opened, opened_rss, visited_rss, widgets
+
+for lazy in (True, False):
+    opened, opened_rss, visited_rss, widgets = open_dialog(lazy)
+    print(f"{'lazy' if lazy else 'eager':<6} open {opened:8.0f} ms | RSS +{opened_rss:6.1f} MB after open, "
+          f"+{visited_rss:6.1f} MB after visiting all tabs | {widgets} Tk widgets at the end")
+
+
 """
     usage notes:
         -> Each tab behaves like a CTkFrame — place widgets using .tab("name").
@@ -146,4 +307,6 @@ app.mainloop()
         -> Use    command=lambda name: ...    to trigger actions when switching tabs.
         -> Customize colors with    segmented_button_*    options for modern designs.
         -> Great for dashboards, settings panels, or multi-step forms.
+        -> For many heavy tabs, build each tab on first selection and unload tabs that have not been
+           shown for a while (Example 5).
 """
@@ -129,6 +129,613 @@ textbox.bind("<KeyRelease>", on_key)
 app.mainloop()
 
 
+# Example 5: Streaming log tail (high-rate appends from any thread)
+# append_line() only puts the line in a deque (under a lock, no Tk calls), and the textbox takes
+# the whole deque once per frame and shows it with a single insert. The oldest lines are trimmed past max_lines, the view
+# only follows new lines while it is scrolled to the bottom, and throughput counters are kept.
+import threading, time
+from collections import deque
+
+class LogTailTextbox(CTkTextbox):
+    def __init__(self, master, max_lines=5000, max_pending=100_000, frame_ms=16, **kwargs):
+        super().__init__(master, **kwargs)
+        self.max_lines = max_lines
+        self.frame_ms = frame_ms
+        self.max_pending = max_pending
+        self._pending = deque(maxlen=max_pending)    # full deque drops the oldest line
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self.stats = {"lines_per_sec": 0.0, "dropped": 0, "trimmed": 0, "inserts": 0}
+        self._window_start, self._window_lines = time.perf_counter(), 0
+        self._flush_job = self.after(self.frame_ms, self._flush)
+
+    def append_line(self, line):
+        """ Safe to call from any thread """
+        with self._lock:
+            if len(self._pending) == self.max_pending:
+                self._dropped += 1
+            self._pending.append(line)
+
+    def _flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, deque(maxlen=self.max_pending)
+            self.stats["dropped"] = self._dropped
+        if batch:
+            pinned = self.yview()[1] >= 0.999           # follow the tail only if already at the bottom
+            state = self.cget("state")
+            self.configure(state="normal")
+            self.insert("end", "\n".join(batch) + "\n")
+            excess = int(self.index("end-1c").split(".")[0]) - 1 - self.max_lines
+            if excess > 0:
+                self.delete("1.0", f"{excess + 1}.0")
+                self.stats["trimmed"] += excess
+            self.configure(state=state)
+            if pinned:
+                self.see("end")
+            self._window_lines += len(batch)
+            self.stats["inserts"] += 1
+        now = time.perf_counter()
+        if now - self._window_start >= 1.0:
+            self.stats["lines_per_sec"] = self._window_lines / (now - self._window_start)
+            self._window_start, self._window_lines = now, 0
+        # poll slower while idle so a quiet log doesn't keep waking the event loop
+        self._flush_job = self.after(self.frame_ms if batch else 100, self._flush)
+
+    def destroy(self):
+        self.after_cancel(self._flush_job)
+        super().destroy()
+
+app = CTk()
+app.title("Log Tail")
+app.geometry("700x450")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+log = LogTailTextbox(app, max_lines=2000, wrap="none", font=("Consolas", 12), state="disabled")
+log.grid(row=0, column=0, sticky="nsew")
+stats_label = CTkLabel(app, text="", anchor="w")
+stats_label.grid(row=1, column=0, sticky="ew", padx=10)
+
+def produce_logs():
+    n = 0
+    while True:
+        for _ in range(50):
+            n += 1
+            log.append_line(f"[worker] request {n} handled in {n % 97} ms")
+        time.sleep(0.01)    # ~5,000 lines/sec
+
+def show_stats():
+    s = log.stats
+    stats_label.configure(text=f"{s['lines_per_sec']:.0f} lines/s | dropped {s['dropped']} | trimmed {s['trimmed']} | inserts {s['inserts']}")
+    app.after(500, show_stats)
+
+threading.Thread(target=produce_logs, daemon=True).start()
+show_stats()
+app.mainloop()
+
+
+# Example 6: Diff-based change events (instead of textbox.get() on every key)
+# The tkinter.Text inside CTkTextbox (textbox._textbox) is wrapped with a Tcl proxy command, so
+# every insert/delete — typed, pasted or programmatic — is reported as a TextChange carrying only
+# the edited range and the inserted/deleted text. Listeners can be debounced; adjacent typing and
+# backspacing are coalesced into one change. Edits Tk ignores (state="disabled") are not reported.
+from collections import namedtuple
+
+TextChange = namedtuple("TextChange", ["kind", "start", "end", "text"])   # kind: insert | delete | reset
+
+class ChangeTrackingTextbox(CTkTextbox):
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self._listeners = []
+        text_widget = self._textbox
+        self._original = text_widget._w + "_original"
+        self.tk.call("rename", text_widget._w, self._original)
+        self.tk.createcommand(text_widget._w, self._proxy)
+
+    def on_change(self, callback, debounce_ms=0, coalesce=True):
+        """ callback(list_of_changes); with debounce_ms > 0 changes are delivered in one batch
+            after typing pauses for that long """
+        self._listeners.append({"callback": callback, "debounce": debounce_ms,
+                                "coalesce": coalesce, "pending": [], "after_id": None})
+
+    def _call(self, *args):
+        return self.tk.call(self._original, *args)
+
+    def _proxy(self, command, *args):
+        if not self._listeners or command not in ("insert", "delete", "replace", "edit"):
+            return self._call(command, *args)
+        if command != "edit" and str(self._call("cget", "-state")) == "disabled":
+            return self._call(command, *args)       # Tk ignores edits in this state: nothing to report
+        changes = []
+        if command == "delete":
+            changes.extend(self._deleted_ranges(args))
+        elif command == "replace":
+            changes.extend(self._deleted_ranges(args[:2]))
+        if command in ("insert", "replace"):
+            index, chunks = (args[0], args[1::2]) if command == "insert" else (args[0], args[2::2])
+            start = str(self._call("index", index))
+            if start == str(self._call("index", "end")):
+                start = str(self._call("index", "end-1c"))   # "end" inserts before the final newline
+            inserted = "".join(chunks)
+            changes.append(TextChange("insert", start, f"{start}+{len(inserted)}c", inserted))
+        result = self._call(command, *args)
+        if command == "edit":
+            if args and args[0] in ("undo", "redo"):
+                changes.append(TextChange("reset", "1.0", "end", None))
+        for change in changes:
+            if change.kind == "insert":   # resolve the end index now that the text is in place
+                change = change._replace(end=str(self._call("index", change.end)))
+            self._dispatch(change)
+        return result
+
+    def _deleted_ranges(self, indices):
+        """ delete index1 ?index2 index3 index4 ...?: one change per range, sorted and merged like Tk
+            does, last range first so every change is still valid after the previous ones """
+        end_of_text = str(self._call("index", "end"))
+        ranges = []
+        for i in range(0, len(indices), 2):
+            start = str(self._call("index", indices[i]))
+            end = str(self._call("index", indices[i + 1] if i + 1 < len(indices) else f"{indices[i]}+1c"))
+            if end == end_of_text:
+                end = str(self._call("index", "end-1c"))   # the final newline can't be deleted
+            if self._call("compare", start, "<", end):
+                ranges.append((start, end))
+        ranges.sort(key=lambda r: tuple(map(int, r[0].split("."))))
+        merged = []
+        for start, end in ranges:
+            if merged and self._call("compare", start, "<=", merged[-1][1]):
+                if self._call("compare", end, ">", merged[-1][1]):
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return [TextChange("delete", start, end, str(self._call("get", start, end)))
+                for start, end in reversed(merged)]
+
+    def _dispatch(self, change):
+        for listener in self._listeners:
+            pending = listener["pending"]
+            if listener["coalesce"] and pending and self._merge(pending, change):
+                pass
+            else:
+                pending.append(change)
+            if listener["debounce"] <= 0:
+                self._deliver(listener)
+            else:
+                if listener["after_id"] is not None:
+                    self.after_cancel(listener["after_id"])
+                listener["after_id"] = self.after(listener["debounce"], self._deliver, listener)
+
+    @staticmethod
+    def _merge(pending, change):
+        last = pending[-1]
+        if last.kind == change.kind == "insert" and last.end == change.start:        # typing
+            pending[-1] = TextChange("insert", last.start, change.end, last.text + change.text)
+            return True
+        if last.kind == change.kind == "delete" and change.end == last.start:        # backspacing
+            pending[-1] = TextChange("delete", change.start, last.end, change.text + last.text)
+            return True
+        return False
+
+    def _deliver(self, listener):
+        listener["after_id"] = None
+        changes, listener["pending"] = listener["pending"], []
+        if changes:
+            listener["callback"](changes)
+
+# derived state (character and line counts) kept up to date from the diffs only
+app = CTk()
+tracked = ChangeTrackingTextbox(app, width=400, height=200)
+tracked.pack(padx=20, pady=(20, 5))
+counts_label = CTkLabel(app, text="0 characters | 1 lines")
+counts_label.pack(padx=20, pady=(0, 20))
+counts = {"chars": 0, "lines": 1}
+
+def on_text_changes(changes):
+    for change in changes:
+        if change.kind == "reset":       # undo/redo: recount once
+            text = tracked.get("0.0", "end-1c")
+            counts["chars"], counts["lines"] = len(text), text.count("\n") + 1
+            continue
+        sign = 1 if change.kind == "insert" else -1
+        counts["chars"] += sign * len(change.text)
+        counts["lines"] += sign * change.text.count("\n")
+    counts_label.configure(text=f"{counts['chars']} characters | {counts['lines']} lines")
+
+tracked.on_change(on_text_changes, debounce_ms=150)
+tracked.insert("0.0", "Type here, the counters update from the edited range only.")
+app.mainloop()
+
+
+# Example 7: Benchmark — typing latency vs document size
+# per keystroke: insert one character + run the change handler
+import time
+
+def keystroke_latency(doc_chars, diff_based, keys=200):
+    app = CTk()
+    box = ChangeTrackingTextbox(app)
+    box.insert("0.0", ("x" * 79 + "\n") * (doc_chars // 80))
+    if diff_based:
+        box.on_change(lambda changes: sum(len(c.text) for c in changes))
+    else:
+        box.bind("<<Typed>>", lambda e: box.get("0.0", "end-1c"))
+    app.update()
+    start = time.perf_counter()
+    for _ in range(keys):
+        box.insert("end-1c", "a")
+        if not diff_based:
+            box.event_generate("<<Typed>>")
+    latency = (time.perf_counter() - start) / keys
+    app.destroy()
+    return latency
+
+for size in (10_000, 1_000_000, 5_000_000):
+    full = keystroke_latency(size, diff_based=False)
+    diff = keystroke_latency(size, diff_based=True)
+    print(f"{size / 1e6:5.2f} MB document | get() per key {full * 1e3:8.3f} ms | change events {diff * 1e3:8.3f} ms")
+
+
+# Example 8: Read-only viewer for huge files (memory-mapped, windowed)
+# The file is memory-mapped and only a window of lines around the visible part (plus a margin) is
+# put into the textbox. A background thread builds a sparse line index (one entry per 256 KB block)
+# with plain buffered reads, so neither the index nor the resident memory grows with the file.
+# The built-in scrollbar is re-wired to show the position in the whole file. Jumps past the indexed
+# part while the index is still being built go to the proportional byte offset (snapped to a line
+# start) with an estimated line number, so no lines are walked across the unindexed part.
+import mmap, os, tempfile
+from bisect import bisect_right
+
+class LargeFileViewer(CTkTextbox):
+    BLOCK = 1 << 18
+
+    def __init__(self, master, path, window_lines=600, margin=150, **kwargs):
+        super().__init__(master, wrap="none", **kwargs)
+        self.path = path
+        self.window_lines = window_lines
+        self.margin = margin
+        self._size = os.path.getsize(path)
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b""
+        self._block_offsets = [0]       # byte offset of each block (always the start of a line)
+        self._block_lines = [0]         # number of the first line in each block
+        self._indexed_lines = self._indexed_bytes = 0
+        self._indexed = False
+        self._window_start = self._window_count = 0
+        self._window_offsets = []       # byte offset of each line in the window, plus its end
+        self._loading = False
+        self._load_job = self._poll_job = None
+
+        self._textbox.configure(yscrollcommand=self._on_view_changed)
+        self._y_scrollbar.configure(command=self._on_scrollbar)
+        threading.Thread(target=self._build_index, daemon=True).start()
+        self._load_window(0)            # first screen right away, index keeps growing behind it
+        self._poll_job = self.after(200, self._poll_index)
+
+    # --- line index (background thread, no Tk calls) ---
+    def _build_index(self):
+        with open(self.path, "rb") as f:
+            offset, line = 0, 0
+            while offset < self._size:
+                chunk = f.read(self.BLOCK)
+                cut = chunk.rfind(b"\n") + 1
+                while cut == 0 and offset + len(chunk) < self._size:   # line longer than a block
+                    chunk += f.read(self.BLOCK)
+                    cut = chunk.rfind(b"\n") + 1
+                cut = cut or len(chunk)
+                line += chunk.count(b"\n", 0, cut)
+                offset += cut
+                f.seek(offset)
+                if offset < self._size:
+                    self._block_offsets.append(offset)    # offsets first: readers index by _block_lines
+                    self._block_lines.append(line)
+                self._indexed_lines, self._indexed_bytes = line, offset
+        self._indexed = True
+
+    def total_lines(self):
+        lines, offset = self._indexed_lines, self._indexed_bytes
+        if self._indexed:
+            return lines + (1 if self._size and self._mm[self._size - 1:self._size] != b"\n" else 0)
+        return max(lines, int(lines / max(offset, 1) * self._size))   # estimate while indexing
+
+    def _line_start(self, line):
+        """ byte offset of a line: from the loaded window or its neighbourhood, the index, or an estimate """
+        mm, first, offsets = self._mm, self._window_start, self._window_offsets
+        if first <= line < first + len(offsets):
+            return offsets[line - first]
+        if offsets and first - self.window_lines <= line < first:     # just above the window
+            pos = offsets[0]
+            for _ in range(first - line):
+                pos = mm.rfind(b"\n", 0, max(pos - 1, 0)) + 1
+            return pos
+        if offsets and 0 < line - (first + len(offsets) - 1) <= self.window_lines:  # just below it
+            pos = offsets[-1]
+            for _ in range(line - (first + len(offsets) - 1)):
+                pos = mm.find(b"\n", pos) + 1 or self._size
+            return pos
+        if line > self._indexed_lines and not self._indexed:
+            # not indexed yet: proportional byte offset, snapped to the next line start
+            pos = mm.find(b"\n", max(int(line / self.total_lines() * self._size) - 1, 0)) + 1
+            return pos if 0 < pos < self._size else mm.rfind(b"\n", 0, self._size - 1) + 1
+        block = bisect_right(self._block_lines, line) - 1
+        pos = self._block_offsets[block]
+        for _ in range(line - self._block_lines[block]):    # at most one block of lines
+            pos = mm.find(b"\n", pos) + 1 or self._size
+        return pos
+
+    def _read_from(self, pos, count):
+        """ up to count lines from byte pos, and the byte offset of each line plus the end """
+        mm = self._mm
+        lines, offsets = [], [pos]
+        while len(lines) < count and pos < self._size:
+            end = mm.find(b"\n", pos)
+            end = self._size if end == -1 else end
+            lines.append(mm[pos:end].decode("utf-8", errors="replace"))
+            pos = end + 1
+            offsets.append(pos)
+        return lines, offsets
+
+    def read_lines(self, first, count):
+        return self._read_from(self._line_start(first), count)[0]
+
+    # --- windowing ---
+    def _load_window(self, top_line):
+        if self._load_job is not None:      # a jump replaces a pending scroll reload
+            self.after_cancel(self._load_job)
+            self._load_job = None
+        self._loading = True
+        start = max(0, min(int(top_line) - self.margin, self.total_lines() - self.window_lines))
+        lines, self._window_offsets = self._read_from(self._line_start(start), self.window_lines)
+        self.configure(state="normal")
+        self.delete("1.0", "end")
+        self.insert("1.0", "\n".join(lines))
+        self.configure(state="disabled")
+        self._window_start, self._window_count = start, max(len(lines), 1)
+        self._textbox.yview(f"{int(top_line) - start + 1}.0")
+        self._loading = False
+        self._on_view_changed(*self._textbox.yview())
+
+    def _on_view_changed(self, first, last):
+        top = self._window_start + float(first) * self._window_count
+        bottom = self._window_start + float(last) * self._window_count
+        total = max(self.total_lines(), 1)
+        self._y_scrollbar.set(top / total, min(1.0, bottom / total))
+        if self._loading:
+            return
+        near_top = top - self._window_start < self.margin / 2 and self._window_start > 0
+        near_bottom = (self._window_start + self._window_count - bottom < self.margin / 2
+                       and self._window_start + self._window_count < total)
+        if near_top or near_bottom:
+            if self._load_job is not None:      # only the latest position matters
+                self.after_cancel(self._load_job)
+            self._load_job = self.after_idle(self._idle_load, top)
+
+    def _idle_load(self, top_line):
+        self._load_job = None
+        self._load_window(top_line)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._load_window(float(amount) * self.total_lines())
+        else:
+            self._textbox.yview_scroll(int(amount), unit)
+
+    def _poll_index(self):
+        self._on_view_changed(*self._textbox.yview())    # scrollbar follows the growing index
+        self._poll_job = None if self._indexed else self.after(200, self._poll_index)
+
+    def destroy(self):
+        for job in (self._load_job, self._poll_job):
+            if job is not None:
+                self.after_cancel(job)
+        super().destroy()
+        if self._size:
+            self._mm.close()
+        self._file.close()
+
+# demo file: pass a (large) path on the command line, or a small 100,000-line sample is generated
+import sys
+
+path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(tempfile.gettempdir(), "ctk_sample_100k.log")
+if not os.path.exists(path):
+    with open(path, "w") as f:
+        for i in range(100_000):
+            f.write(f"{i:>9} | 2024-01-01 12:00:{i % 60:02d} | INFO | sample log line number {i}\n")
+
+app = CTk()
+app.title("Large File Viewer")
+app.geometry("800x500")
+start = time.perf_counter()
+viewer = LargeFileViewer(app, path, font=("Consolas", 12))
+viewer.pack(fill="both", expand=True)
+app.update()
+print(f"opened {os.path.getsize(path) / 2**20:.0f} MB in {(time.perf_counter() - start) * 1000:.0f} ms")
+app.mainloop()
+
+
+# Example 9: Incremental syntax highlighting for code editors
+# A tokenizer lexes one line at a time and returns the state at the end of the line (e.g. "inside a
+# triple-quoted string"). After an edit only the damaged lines are re-lexed; lexing continues past
+# them only while the end-of-line state keeps changing. Tags are removed/added in one batch per
+# slice, and work runs in short idle slices so typing never waits for the highlighter.
+# Uses ChangeTrackingTextbox (Example 6) to learn which lines were edited.
+import builtins, keyword, re
+
+_PY_TOKEN = re.compile(r'(?P<comment>#.*)|(?P<triple>"""|\'\'\')'
+                       r'|(?P<string>"[^"\\]*(?:\\.[^"\\]*)*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\')'
+                       r'|(?P<number>\b\d+(?:\.\d*)?\b)|(?P<name>\b[A-Za-z_]\w*\b)')
+_BUILTINS = set(dir(builtins))
+
+def python_tokenizer(line, state):
+    """ -> ([(start_col, end_col, tag), ...], state at end of line); state = open triple quote or None """
+    tokens, pos = [], 0
+    if state:
+        end = line.find(state)
+        if end == -1:
+            return [(0, len(line), "string")], state
+        tokens.append((0, end + 3, "string"))
+        pos = end + 3
+    after_def = False
+    while True:
+        m = _PY_TOKEN.search(line, pos)
+        if m is None:
+            return tokens, None
+        kind, pos = m.lastgroup, m.end()
+        if kind == "triple":
+            end = line.find(m.group(), pos)
+            if end == -1:
+                tokens.append((m.start(), len(line), "string"))
+                return tokens, m.group()
+            tokens.append((m.start(), end + 3, "string"))
+            pos = end + 3
+        elif kind == "name":
+            word = m.group()
+            if after_def:
+                tokens.append((m.start(), pos, "definition"))
+            elif keyword.iskeyword(word):
+                tokens.append((m.start(), pos, "keyword"))
+            elif word in _BUILTINS:
+                tokens.append((m.start(), pos, "builtin"))
+            after_def = word in ("def", "class")
+        else:
+            tokens.append((m.start(), pos, kind))
+
+PYTHON_STYLES = {"keyword": "#C586C0", "builtin": "#4EC9B0", "definition": "#DCDCAA",
+                 "string": "#CE9178", "comment": "#6A9955", "number": "#B5CEA8"}
+
+_UNKNOWN = object()   # end-of-line state of a line that was never lexed
+
+class IncrementalHighlighter:
+    def __init__(self, textbox, tokenizer=python_tokenizer, styles=PYTHON_STYLES, slice_ms=8):
+        self.textbox = textbox
+        self.tokenizer = tokenizer
+        self.styles = styles
+        self.slice_ms = slice_ms
+        self._states = []           # lexer state at the end of each line (0-based)
+        self._dirty = None          # first line to re-lex, None when everything is highlighted
+        self._damage_end = 0        # re-lex at least up to this line
+        self._job = None
+        self.stats = {"lines_lexed": 0, "slices": 0}
+        for tag, color in styles.items():
+            textbox.tag_config(tag, foreground=color)
+        textbox.on_change(self._on_changes)
+        self.invalidate(0, int(textbox.index("end-1c").split(".")[0]))
+
+    def _on_changes(self, changes):
+        for change in changes:
+            if change.kind == "reset":
+                self._states = []
+                self.invalidate(0, int(self.textbox.index("end-1c").split(".")[0]))
+                continue
+            line = int(change.start.split(".")[0]) - 1
+            newlines = change.text.count("\n")
+            shift = newlines if change.kind == "insert" else -newlines
+            if line < len(self._states):
+                if change.kind == "insert":
+                    self._states[line:line] = [_UNKNOWN] * newlines
+                else:
+                    del self._states[line:line + newlines]
+            if self._dirty is not None and line < self._damage_end:
+                self._damage_end = max(line, self._damage_end + shift)   # pending damage moves with the text
+            self.invalidate(line, line + max(shift, 0))
+
+    def invalidate(self, first_line, last_line):
+        self._dirty = first_line if self._dirty is None else min(self._dirty, first_line)
+        self._damage_end = max(self._damage_end, last_line)
+        if self._job is None:
+            self._job = self.textbox.after_idle(self._run_slice)
+
+    def _run_slice(self, budget=True):
+        self._job = None
+        if self._dirty is None:
+            return
+        deadline = time.perf_counter() + self.slice_ms / 1000
+        text = self.textbox
+        total = int(text.index("end-1c").split(".")[0])
+        first = line = self._dirty
+        state = self._states[line - 1] if 0 < line <= len(self._states) else None
+        ranges = {tag: [] for tag in self.styles}
+        finished = line >= total
+        while not finished:
+            tokens, state = self.tokenizer(text.get(f"{line + 1}.0", f"{line + 1}.end"), state)
+            for start, end, tag in tokens:
+                ranges[tag] += (f"{line + 1}.{start}", f"{line + 1}.{end}")
+            previous = self._states[line] if line < len(self._states) else _UNKNOWN
+            if line < len(self._states):
+                self._states[line] = state
+            else:
+                self._states.append(state)
+            line += 1
+            # stop once past the edit and the lexer is back in the state it had before
+            finished = line >= total or (line > self._damage_end and state == previous)
+            if budget and time.perf_counter() > deadline:
+                break
+        # one batch of tag changes for the whole slice
+        for tag, indices in ranges.items():
+            text.tag_remove(tag, f"{first + 1}.0", f"{line + 1}.0")
+            if indices:
+                text.tag_add(tag, *indices)
+        del self._states[total:]
+        self.stats["lines_lexed"] += line - first
+        self.stats["slices"] += 1
+        if finished:
+            self._dirty, self._damage_end = None, 0
+        else:
+            self._dirty = line
+            self._job = text.after(1, self._run_slice)   # let pending keystrokes in first
+
+    def flush(self):
+        """ highlight everything that is pending right now (used by the benchmark) """
+        if self._job is not None:
+            self.textbox.after_cancel(self._job)
+            self._job = None
+        while self._dirty is not None:
+            self._run_slice(budget=False)
+
+SAMPLE_CODE = '''import os
+
+class Greeter:
+    """Say hello
+    to everyone."""
+
+    def greet(self, name):
+        # print a greeting
+        message = f"Hello, {name}!"
+        print(message, len(name), 42)
+        return message
+'''
+
+app = CTk()
+app.title("Incremental Highlighting")
+editor = ChangeTrackingTextbox(app, width=600, height=350, wrap="none", font=("Consolas", 14))
+editor.pack(padx=20, pady=20, fill="both", expand=True)
+editor.insert("0.0", SAMPLE_CODE * 50)
+highlighter = IncrementalHighlighter(editor)
+app.mainloop()
+
+
+# Example 10: Benchmark — per-keystroke highlight latency on a 100k-line Python file
+app = CTk()
+editor = ChangeTrackingTextbox(app, wrap="none")
+source = SAMPLE_CODE * (100_000 // SAMPLE_CODE.count("\n"))
+editor.insert("0.0", source)
+start = time.perf_counter()
+highlighter = IncrementalHighlighter(editor)
+highlighter.flush()
+full = time.perf_counter() - start
+print(f"{source.count(chr(10))} lines | full highlight {full * 1000:.0f} ms")
+
+import random
+latencies = []
+for _ in range(200):
+    line = random.randint(1, 100_000)
+    start = time.perf_counter()
+    editor.insert(f"{line}.0", "x")
+    highlighter.flush()
+    latencies.append(time.perf_counter() - start)
+latencies.sort()
+print(f"per keystroke: median {latencies[100] * 1000:.2f} ms | worst {latencies[-1] * 1000:.2f} ms")
+app.destroy()
+
+
 """
     usage notes:
         -> Use indices like "0.0" (line 0, char 0) or "end" to insert/get/delete text.
@@ -137,4 +744,10 @@ app.mainloop()
         -> Retrieve content with    .get("0.0", "end-1c")    to exclude the trailing newline.
         -> Supports most tkinter.Text methods, so it's versatile for text editors.
         -> Customize scrollbar colors for better UI theming.
+        -> Never call textbox methods from worker threads; queue lines and insert them in one batch
+           per frame from the Tk thread, and trim old lines so a log view doesn't grow forever (Example 5).
+        -> Avoid    .get("0.0", "end-1c")    in per-key handlers on large documents; react to the edited
+           range instead (Example 6) and debounce expensive work.
+        -> Don't insert huge files whole; memory-map them and show a window of lines (Example 8).
+        -> For syntax highlighting, re-tag only the lines an edit damaged, in idle slices (Example 9).
 """
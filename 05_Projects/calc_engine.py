@@ -0,0 +1,644 @@
+"""
+ClearMath calculation engine
+
+    definition:
+        - Turns a calculator display string into a result string without calling eval().
+        - Expressions are tokenized and compiled once (shunting-yard → postfix program),
+          then the compiled program is run; compiled programs are kept in an LRU cache.
+        - Accepted syntax: decimal numbers, + - * / // % ** , unary +/- and parentheses.
+        - Same rules as the original evaluator:
+            → "×" and "÷" are read as "*" and "/"
+            → a number directly followed by "%" means number/100  (e.g. "50%" → 0.5)
+            → trailing operators / dots are ignored                (e.g. "5+" → 5)
+            → results are rounded to 6 decimal places
+            → anything invalid (syntax, division by zero, ...) gives "Error"
+
+    numeric backends (the backend argument, default "float"):
+        "float"         → Python numbers, exactly like the original eval() (ints stay ints)
+        "decimal"       → decimal.Decimal, exact decimal arithmetic (28 significant digits),
+                          // and % floor like the other backends (-7//2 → -4, -7 %3 → 2)
+        "fraction"      → fractions.Fraction, exact rational arithmetic
+        "numpy"         → evaluate_many() only: expressions with the same operator layout are
+                          evaluated together on NumPy float64 arrays; returns an ndarray with
+                          NaN where the result would be "Error" (non-finite results included)
+
+    functions:
+        evaluate_expression(expr, backend="float")  → evaluate one display string, returns result text or "Error"
+        evaluate_many(exprs, backend="float")       → evaluate an iterable of display strings,
+                                                      returns an iterator of results (an ndarray for "numpy")
+        compile_expression(expr, backend="float")   → cached compiled program for a display string (None if invalid)
+        run_program(program)                        → run a compiled program, returns the raw number
+
+    classes:
+        LiveEvaluator(text="")      → incremental evaluator for a display that is edited one key at a time
+            .append(chars)          → feed typed characters
+            .backspace(count=1)     → remove the last character(s)
+            .clear()                → empty the display
+            .keystroke(char, length, at_end)
+                                    → keyboard fast path: True if the display change was char typed
+                                      ("\b" for BackSpace) at the end, otherwise call .sync(text)
+            .sync(text)             → catch up with a display that was edited some other way
+            .result()               → same text evaluate_expression() would give for the current display
+
+    benchmark:
+        python calc_engine.py [n]   → compares this engine with the old eval() path, measures
+                                      LiveEvaluator keystroke latency and the throughput of every
+                                      numeric backend on n evaluations (default 1,000,000)
+"""
+
+import operator
+import re
+from collections import namedtuple
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache, partial
+
+ERROR = "Error"
+CACHE_SIZE = 4096
+
+_PERCENT_RE = re.compile(r'(\d+)%')
+_TOKEN_RE = re.compile(r'[ \t\f]*(?:(\d+\.\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+)|(\d+)|(\*\*|//|[-+*/%()]))', re.ASCII)
+
+# operator → (precedence, right associative, arity, function)
+_BINARY = {
+    "+": (1, False, 2, operator.add),
+    "-": (1, False, 2, operator.sub),
+    "*": (2, False, 2, operator.mul),
+    "/": (2, False, 2, operator.truediv),
+    "//": (2, False, 2, operator.floordiv),
+    "%": (2, False, 2, operator.mod),
+    "**": (4, True, 2, operator.pow),
+}
+_UNARY = {
+    "+": (3, True, 1, operator.pos),
+    "-": (3, True, 1, operator.neg),
+}
+
+
+def normalize(expr: str) -> str:
+    """ Apply the display rules (symbols, percent, trailing operators) before parsing """
+    expr = expr.replace("×", "*").replace("÷", "/")
+    expr = _PERCENT_RE.sub(r'(\1/100)', expr)
+    return expr.rstrip("+-*/.")
+
+
+def tokenize(expr: str):
+    """ Yield (kind, text) tokens, kind is "float", "int" or "op"; raises ValueError on bad input """
+    pos, end = 0, len(expr)
+    match = _TOKEN_RE.match
+    while pos < end:
+        m = match(expr, pos)
+        if m is None:
+            if not expr[pos:].strip(" \t\f"):
+                return
+            raise ValueError(f"unexpected character at {pos}")
+        pos = m.end()
+        if m.group(1):
+            yield "float", m.group(1)
+        elif m.group(2):
+            yield "int", m.group(2)
+        else:
+            yield "op", m.group(3)
+
+
+def _parse_int(text: str) -> int:
+    # Python rejects leading zeros ("07") but accepts "0" and "00"
+    if text[0] == "0" and text.strip("0"):
+        raise ValueError("leading zeros in decimal integer literal")
+    return int(text)
+
+
+def _python_number(kind: str, text: str):
+    return float(text) if kind == "float" else _parse_int(text)
+
+
+def parse(expr: str, number=_python_number):
+    """ Compile a normalized expression into a postfix program: a tuple of (arity, value_or_function)
+
+        number(kind, text) turns a literal token into the value stored in the program """
+    output, stack = [], []
+    expect_operand = True
+    for kind, text in tokenize(expr):
+        if kind != "op":
+            if not expect_operand:
+                raise ValueError("missing operator")
+            output.append((0, number(kind, text)))
+            expect_operand = False
+        elif text == "(":
+            if not expect_operand:
+                raise ValueError("unexpected '('")
+            stack.append(None)
+        elif text == ")":
+            if expect_operand:
+                raise ValueError("unexpected ')'")
+            while stack and stack[-1] is not None:
+                output.append(stack.pop()[2:])
+            if not stack:
+                raise ValueError("unbalanced ')'")
+            stack.pop()
+        elif expect_operand:
+            # prefix operators never pop anything, they bind to the operand that follows
+            if text not in _UNARY:
+                raise ValueError(f"unexpected operator {text!r}")
+            stack.append(_UNARY[text])
+        else:
+            info = _BINARY[text]
+            precedence, right = info[0], info[1]
+            while stack and stack[-1] is not None:
+                top = stack[-1][0]
+                if top > precedence or (top == precedence and not right):
+                    output.append(stack.pop()[2:])
+                else:
+                    break
+            stack.append(info)
+            expect_operand = True
+    if expect_operand:
+        raise ValueError("incomplete expression")
+    while stack:
+        item = stack.pop()
+        if item is None:
+            raise ValueError("unbalanced '('")
+        output.append(item[2:])
+    return tuple(output)
+
+
+# --- Numeric backends ---
+def _format_decimal(value: Decimal) -> str:
+    return format(value.normalize(), "f")
+
+
+def _round_decimal(value: Decimal) -> Decimal:
+    # quantizing to 6 places needs the integer digits + 6 digits of precision, the default 28 is too few from 1e22 on
+    with localcontext() as ctx:
+        ctx.prec = max(value.adjusted() + 7, 1)
+        return round(value, 6)
+
+
+def _decimal_floordiv(a: Decimal, b: Decimal) -> Decimal:
+    # Decimal // truncates toward zero, the other backends floor: -7//2 → -4 everywhere
+    quotient, remainder = divmod(a, b)
+    if remainder and (remainder < 0) != (b < 0):
+        quotient -= 1
+    return quotient
+
+
+def _decimal_mod(a: Decimal, b: Decimal) -> Decimal:
+    # the result takes the sign of the divisor, like int/float/Fraction: -7 %3 → 2
+    remainder = a % b
+    if remainder and (remainder < 0) != (b < 0):
+        remainder += b
+    return remainder
+
+
+def _format_fraction(value) -> str:
+    if not isinstance(value, Fraction):
+        # fractional powers leave the rationals ("4**0.5"), fall back to float formatting
+        return str(round(value, 6))
+    value = round(value, 6)
+    if value.denominator == 1:
+        return str(value.numerator)
+    with localcontext() as ctx:
+        ctx.prec = len(str(abs(value.numerator))) + 7
+        return _format_decimal(Decimal(value.numerator) / value.denominator)
+
+
+# operators: replacements for the functions of _BINARY / _UNARY in compiled programs
+NumericBackend = namedtuple("NumericBackend", ["number", "format", "operators"], defaults=(None,))
+
+BACKENDS = {
+    "float": NumericBackend(_python_number, lambda value: str(round(value, 6))),
+    "decimal": NumericBackend(lambda kind, text: Decimal(_parse_int(text) if kind == "int" else text),
+                              lambda value: _format_decimal(_round_decimal(value)),
+                              {operator.floordiv: _decimal_floordiv, operator.mod: _decimal_mod}),
+    "fraction": NumericBackend(lambda kind, text: Fraction(_parse_int(text) if kind == "int" else text),
+                               _format_fraction),
+}
+
+
+def _backend(name: str) -> NumericBackend:
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown numeric backend {name!r} (numpy works with evaluate_many only)") from None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(expr: str, backend: str = "float"):
+    """ Normalize and compile a display string; the result is cached, None means invalid """
+    number, _, operators = _backend(backend)
+    try:
+        program = parse(normalize(expr), number)
+    except ValueError:
+        return None
+    if operators:
+        program = tuple((arity, operators.get(item, item) if arity else item) for arity, item in program)
+    return program
+
+
+def run_program(program):
+    """ Execute a compiled postfix program and return the raw (unrounded) number """
+    stack = []
+    push, pop = stack.append, stack.pop
+    for arity, item in program:
+        if arity == 0:
+            push(item)
+        elif arity == 1:
+            stack[-1] = item(stack[-1])
+        else:
+            right = pop()
+            stack[-1] = item(stack[-1], right)
+    return stack[0]
+
+
+def evaluate_expression(expr: str, backend: str = "float") -> str:
+    program = compile_expression(expr, backend)
+    if program is None:
+        return ERROR
+    try:
+        return BACKENDS[backend].format(run_program(program))
+    except Exception:
+        return ERROR
+
+
+def evaluate_many(exprs, backend: str = "float"):
+    """ Batch entry point: lazily evaluates every string of an iterable """
+    if backend == "numpy":
+        return _evaluate_numpy(exprs)
+    _backend(backend)
+    return map(partial(evaluate_expression, backend=backend), exprs)
+
+
+# --- NumPy backend ---
+# Expressions are split into a layout ("1 +1 *1 ") and their literals (["12", "3.5", "7"]).
+# Each distinct layout is compiled once with literal slots, then run a single time over
+# float64 columns holding the literals of every expression that shares it.
+_LITERAL_RE = re.compile(r'\d+\.\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|\d+(?:[eE][+-]?\d+)?', re.ASCII)
+_LEADING_ZERO_RE = re.compile(r'(?<![\d.eE])(?<![eE][+-])0+[1-9]\d*(?![\d.eE])', re.ASCII)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_layout(layout: str):
+    slots = iter(range(len(layout)))
+    try:
+        return parse(layout, lambda kind, text: next(slots))
+    except ValueError:
+        return None
+
+
+def _run_columns(program, columns):
+    stack = []
+    push, pop = stack.append, stack.pop
+    for arity, item in program:
+        if arity == 0:
+            push(columns[item])
+        elif arity == 1:
+            stack[-1] = item(stack[-1])
+        else:
+            right = pop()
+            stack[-1] = item(stack[-1], right)
+    return stack[0]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _split_literals(expr: str):
+    """ (layout, literals) for a display string, None if it can't be valid """
+    text = normalize(expr)
+    if _LEADING_ZERO_RE.search(text):
+        return None
+    # the trailing space keeps neighbouring literals ("1.2.3") from merging into one token
+    layout = _LITERAL_RE.sub("1 ", text)
+    if "." in layout or "e" in layout.lower():
+        return None
+    return layout, tuple(_LITERAL_RE.findall(text))
+
+
+def _evaluate_numpy(exprs):
+    import numpy as np
+
+    exprs = list(exprs)
+    results = np.full(len(exprs), np.nan)
+    groups = {}
+    for i, expr in enumerate(exprs):
+        split = _split_literals(expr)
+        if split is None:
+            continue
+        group = groups.get(split[0])
+        if group is None:
+            group = groups[split[0]] = ([], [])
+        group[0].append(i)
+        group[1].append(split[1])
+    with np.errstate(all="ignore"):
+        for layout, (rows, literals) in groups.items():
+            program = _compile_layout(layout)
+            if program is None:
+                continue
+            columns = np.array(literals, dtype=np.float64).reshape(len(rows), -1).T
+            results[rows] = _run_columns(program, columns)
+        results[~np.isfinite(results)] = np.nan
+        return np.round(results, 6)
+
+
+# --- Incremental (live) evaluation ---
+# The live evaluator runs the same shunting-yard algorithm one character at a time, but reduces
+# operators eagerly into values instead of emitting a program. Its stacks are immutable linked
+# lists ((head, tail) tuples), so the state after every keystroke is kept as an O(1) snapshot:
+# backspace just drops the last snapshot and the result only has to unwind the (short) stacks.
+
+_NUMBER_RE = re.compile(r'\d+\.\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+|(\d+)', re.ASCII)
+_LITERAL_CHARS = frozenset("0123456789.")
+_STRIP_CHARS = frozenset("+-*/.")
+_SYMBOLS = {"×": "*", "÷": "/"}
+
+# state tuple: (values, ops, expect_operand, literal, pending_operator, error)
+_EMPTY_STATE = (None, None, True, None, None, False)
+_ERROR_STATE = (None, None, False, None, None, True)
+
+
+def _literal_value(text: str):
+    m = _NUMBER_RE.fullmatch(text)
+    if m is None:
+        raise ValueError(f"invalid number {text!r}")
+    return _parse_int(text) if m.group(1) else float(text)
+
+
+def _apply(values, info):
+    if info[2] == 1:
+        value, rest = values
+        return info[3](value), rest
+    right, (left, rest) = values
+    return info[3](left, right), rest
+
+
+def _close_literal(state):
+    values, ops, _, literal, _, _ = state
+    if literal is None:
+        return values, ops
+    return (_literal_value(literal), values), ops
+
+
+def _push_operator(values, ops, info):
+    precedence, right = info[0], info[1]
+    while ops is not None and ops[0] is not None:
+        top = ops[0][0]
+        if top > precedence or (top == precedence and not right):
+            values = _apply(values, ops[0])
+            ops = ops[1]
+        else:
+            break
+    return values, (info, ops)
+
+
+def _step(state, before, ch, previous):
+    """ Return the state after typing ch; before is the state preceding the last character """
+    values, ops, expect_operand, literal, pending, error = state
+    if error:
+        return state
+    if ch in _LITERAL_CHARS or (literal is not None and (ch in "eE" and "e" not in literal.lower()
+                                                         or ch in "+-" and literal[-1] in "eE")):
+        if literal is not None:
+            return values, ops, False, literal + ch, None, False
+        if expect_operand and ch in _LITERAL_CHARS:
+            return values, ops, False, ch, None, False
+        return _ERROR_STATE
+    if ch in " \t\f":
+        values, ops = _close_literal(state)
+        return values, ops, expect_operand, None, None, False
+    if ch == "%" and literal is not None and previous.isdigit():
+        # "(\d+)%" → "(\1/100)": only a plain integer literal can take a percent sign
+        if not literal.isdigit():
+            return _ERROR_STATE
+        return (_parse_int(literal) / 100, values), ops, False, None, None, False
+    if ch in "*/" and pending == ch:
+        # second half of "**" or "//": redo the operator from the state before the first half
+        values, ops = _close_literal(before)
+        values, ops = _push_operator(values, ops, _BINARY[ch * 2])
+        return values, ops, True, None, None, False
+    if ch == "(":
+        if not expect_operand:
+            return _ERROR_STATE
+        return values, (None, ops), True, None, None, False
+    values, ops = _close_literal(state)
+    if ch == ")":
+        if expect_operand:
+            return _ERROR_STATE
+        while ops is not None and ops[0] is not None:
+            values = _apply(values, ops[0])
+            ops = ops[1]
+        if ops is None:
+            return _ERROR_STATE
+        return values, ops[1], False, None, None, False
+    if ch in _BINARY:
+        if expect_operand:
+            if ch not in _UNARY:
+                return _ERROR_STATE
+            return values, (_UNARY[ch], ops), True, None, None, False
+        values, ops = _push_operator(values, ops, _BINARY[ch])
+        return values, ops, True, None, ch if ch in "*/" else None, False
+    return _ERROR_STATE
+
+
+def _finish(state):
+    values, ops = _close_literal(state)
+    if state[2]:
+        raise ValueError("incomplete expression")
+    while ops is not None:
+        if ops[0] is None:
+            raise ValueError("unbalanced '('")
+        values = _apply(values, ops[0])
+        ops = ops[1]
+    return values[0]
+
+
+class LiveEvaluator:
+    """ Incremental evaluator: every keystroke costs O(1) amortized instead of a full re-parse """
+
+    def __init__(self, text=""):
+        self.clear()
+        self.append(text)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chars)
+
+    def __len__(self):
+        return len(self._chars)
+
+    def clear(self):
+        self._chars = []
+        self._states = [_EMPTY_STATE]
+        # _kept[i] = length of the first i characters once trailing "+-*/." are stripped
+        self._kept = [0]
+
+    def append(self, chars: str):
+        for ch in chars:
+            states = self._states
+            normalized = _SYMBOLS.get(ch, ch)
+            previous = _SYMBOLS.get(self._chars[-1], self._chars[-1]) if self._chars else ""
+            try:
+                state = _step(states[-1], states[-2] if len(states) > 1 else None, normalized, previous)
+            except Exception:
+                state = _ERROR_STATE
+            self._chars.append(ch)
+            states.append(state)
+            self._kept.append(self._kept[-1] if normalized in _STRIP_CHARS else len(self._chars))
+
+    def backspace(self, count=1):
+        for _ in range(min(count, len(self._chars))):
+            self._chars.pop()
+            self._states.pop()
+            self._kept.pop()
+
+    def keystroke(self, char: str, length: int, at_end: bool) -> bool:
+        """ Apply one key without reading the display: length is the display length after the key,
+            at_end whether the cursor is at its end. False means the edit was something else
+            (paste, edit in the middle, several keys at once) and sync() is needed """
+        if not at_end:
+            return False
+        chars = self._chars
+        if char == "\b" and length == len(chars) - 1:
+            self.backspace()
+        elif len(char) == 1 and length == len(chars) + 1:
+            self.append(char)
+        elif length != len(chars) or (char and char != "\b" and chars[-1:] != [char]):
+            return False
+        # same length: a key that typed nothing (Shift, arrows) or a release already synced
+        return True
+
+    def sync(self, text: str):
+        """ Reuse the longest common prefix with the current display, then replay the rest """
+        chars = self._chars
+        common = 0
+        limit = min(len(chars), len(text))
+        while common < limit and chars[common] == text[common]:
+            common += 1
+        self.backspace(len(chars) - common)
+        self.append(text[common:])
+
+    def result(self) -> str:
+        state = self._states[self._kept[-1]]
+        if state[5]:
+            return ERROR
+        try:
+            return str(round(_finish(state), 6))
+        except Exception:
+            return ERROR
+
+
+# --- Benchmark: compiled engine vs the old eval() path ---
+def _legacy_evaluate(expr: str) -> str:
+    try:
+        expr = expr.replace("×", "*").replace("÷", "/")
+        expr = re.sub(r'(\d+)%', r'(\1/100)', expr)
+        while expr and expr[-1] in "+-*/.": expr = expr[:-1]
+        result = eval(expr, {"__builtins__": None}, {})
+        return str(round(result, 6))
+    except Exception:
+        return "Error"
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+    import warnings
+
+    warnings.simplefilter("ignore", SyntaxWarning)  # eval() warns about inputs like "5(3)"
+    random.seed(0)
+    symbols = ["+", "-", "×", "÷", "%"]
+
+    def random_expr():
+        parts = [str(random.randint(0, 999))]
+        for _ in range(random.randint(1, 8)):
+            parts.append(random.choice(symbols) if parts[-1] != "%" else random.choice("+-×÷"))
+            parts.append(str(random.randint(1, 999)))
+        return "".join(parts)
+
+    unique = [random_expr() for _ in range(20000)]
+    repeated = [random.choice(unique[:500]) for _ in range(200000)]
+
+    mismatches = [e for e in unique if evaluate_expression(e) != _legacy_evaluate(e)]
+    print(f"checked {len(unique)} expressions, mismatches: {len(mismatches)}")
+
+    # where float is exact, the exact backends must give the same numbers (formatting aside)
+    edge_cases = ["-7//2", "7//-2", "-7 %3", "7 %-3", "-7.5//2", "-7.5 %2", "10**22",
+                  "99999999999999999999999", "1e25", "-10**25//4", "2**80 %-7"]
+
+    def same_number(a, b):
+        return a == b or (ERROR not in (a, b) and Decimal(a) == Decimal(b))
+
+    backend_mismatches = [(e, backend) for e in edge_cases for backend in ("decimal", "fraction")
+                          if not same_number(evaluate_expression(e, backend), evaluate_expression(e))]
+    print(f"checked {len(edge_cases)} edge cases on the exact backends, mismatches: {backend_mismatches}")
+
+    for name, data in [("unique", unique), ("repeated", repeated)]:
+        compile_expression.cache_clear()
+        start = time.perf_counter()
+        for e in data: _legacy_evaluate(e)
+        legacy = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in evaluate_many(data): pass
+        engine = time.perf_counter() - start
+        print(f"{name:>8}: {len(data)} exprs | eval() {legacy:.3f}s | engine {engine:.3f}s | speedup x{legacy / engine:.1f}")
+
+    # live preview: cost of one keystroke (append + result) along a 10k-character expression
+    keys = ""
+    while len(keys) < 10000:
+        keys += f"{random.randint(1, 999)}{random.choice('×÷')}{random.randint(1, 99)}{random.choice('+-')}"
+    keys = keys[:10000]
+    # button path: append(); keyboard path: keystroke() with the entry length; fallback: sync(entry text)
+    live, typed, synced = LiveEvaluator(), LiveEvaluator(), LiveEvaluator()
+    timings, key_timings, sync_timings = [], [], []
+    for i, ch in enumerate(keys):
+        start = time.perf_counter()
+        live.append(ch)
+        live.result()
+        timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        typed.keystroke(ch, i + 1, True)
+        typed.result()
+        key_timings.append(time.perf_counter() - start)
+        text = keys[:i + 1]         # what entry.get() returns
+        start = time.perf_counter()
+        synced.sync(text)
+        synced.result()
+        sync_timings.append(time.perf_counter() - start)
+    assert live.result() == typed.result() == synced.result() == evaluate_expression(keys)
+    print("live preview, µs per keystroke:")
+    for mark in (1000, 2500, 5000, 7500, 10000):
+        compile_expression.cache_clear()
+        start = time.perf_counter()
+        evaluate_expression(keys[:mark])
+        full = time.perf_counter() - start
+        button, keyboard, fallback = (sum(t[mark - 1000:mark]) / 1000 * 1e6 for t in (timings, key_timings, sync_timings))
+        print(f"  chars {mark - 1000:>5}-{mark:<5}: button {button:6.1f} | keyboard {keyboard:6.1f} "
+              f"| sync() {fallback:7.1f} | full re-parse {full * 1e6:8.1f}")
+    start = time.perf_counter()
+    for _ in range(1000): live.backspace(); live.result()
+    print(f"  backspace: {(time.perf_counter() - start) / 1000 * 1e6:.1f} µs per keystroke")
+
+    # numeric backends: throughput on the same batch of expressions
+    try:
+        import numpy  # noqa: F401
+        backends = ["float", "decimal", "fraction", "numpy"]
+    except ImportError:
+        backends = ["float", "decimal", "fraction"]
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    # unique expressions that share a few operator layouts, e.g. a price × quantity + fee sheet
+    shapes = [[random.choice("+-×÷") for _ in range(random.randint(1, 6))] for _ in range(20)]
+
+    def random_numbers(ops):
+        return str(random.randint(1, 999)) + "".join(op + str(random.randint(1, 999)) for op in ops)
+
+    batches = [("repeated", count, [random.choice(unique[:2000]) for _ in range(count)]),
+               ("unique", count // 10, [random_numbers(random.choice(shapes)) for _ in range(count // 10)])]
+    for name, size, batch in batches:
+        print(f"numeric backends, {size} evaluations ({name} expressions):")
+        for backend in backends:
+            compile_expression.cache_clear()
+            _split_literals.cache_clear()
+            start = time.perf_counter()
+            results = evaluate_many(batch, backend)
+            if backend != "numpy":
+                for _ in results: pass
+            elapsed = time.perf_counter() - start
+            print(f"  {backend:>8}: {elapsed:6.2f}s | {size / elapsed / 1000:8.1f}k evaluations/s")
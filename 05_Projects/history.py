@@ -0,0 +1,178 @@
+"""
+ClearMath calculation history
+
+    definition:
+        - CalculationHistory keeps the last `capacity` calculations in a fixed-size ring buffer,
+          so memory stays bounded no matter how long the app runs.
+        - A sorted prefix index (bisect) over the expressions answers "starts with" searches
+          without scanning the whole history.
+        - Entries are persisted in an append-only text file (one "expression<TAB>result" per line);
+          the file is only read on first use (lazy load) and compacted when it grows too long.
+        - HistoryView is a virtualized list: it owns a small, fixed pool of row buttons and
+          re-binds them to entries while scrolling, so 10k entries cost the same as 10.
+
+    classes:
+        CalculationHistory(capacity=10000, path=None)
+            .add(expression, result)        → store a calculation (and append it to the file)
+            .load()                         → read the file now (otherwise done on first use)
+            len(history), history[i]        → i = 0 is the newest entry
+            .search(prefix, limit=None)     → newest-first entries whose expression starts with prefix
+
+        HistoryView(master, history, command, rows=12, **kwargs)
+            .refresh()                      → re-read the history and re-run the active search (call after add)
+"""
+
+import os
+from bisect import bisect_left, insort
+
+import customtkinter as ctk
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".clearmath_history")
+
+
+class CalculationHistory:
+    def __init__(self, capacity=10000, path=None):
+        self.capacity = capacity
+        self.path = path
+        self._expressions = [None] * capacity
+        self._results = [None] * capacity
+        self._next_seq = 0          # sequence number of the next entry; slot = seq % capacity
+        self._index = []            # sorted (expression, seq) pairs for prefix search
+        self._loaded = path is None
+
+    # --- ring buffer ---
+    def _store(self, expression, result):
+        seq = self._next_seq
+        slot = seq % self.capacity
+        if seq >= self.capacity:
+            # evict the oldest entry that lives in this slot
+            old = (self._expressions[slot], seq - self.capacity)
+            del self._index[bisect_left(self._index, old)]
+        self._expressions[slot] = expression
+        self._results[slot] = result
+        insort(self._index, (expression, seq))
+        self._next_seq = seq + 1
+
+    def __len__(self):
+        self.load()
+        return min(self._next_seq, self.capacity)
+
+    def __getitem__(self, i):
+        if not 0 <= i < len(self):
+            raise IndexError("history index out of range")
+        slot = (self._next_seq - 1 - i) % self.capacity
+        return self._expressions[slot], self._results[slot]
+
+    def add(self, expression, result):
+        self.load()
+        expression = " ".join(expression.split())
+        self._store(expression, result)
+        if self.path:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(f"{expression}\t{result}\n")
+
+    def search(self, prefix, limit=None):
+        self.load()
+        matches = []
+        for expression, seq in self._index[bisect_left(self._index, (prefix, -1)):]:
+            if not expression.startswith(prefix):
+                break
+            matches.append(seq)
+        matches.sort(reverse=True)
+        slots = [seq % self.capacity for seq in matches[:limit]]
+        return [(self._expressions[s], self._results[s]) for s in slots]
+
+    # --- persistence ---
+    def load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        lines, total = [], 0
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                lines.append(line)
+                total += 1
+                if len(lines) >= 2 * self.capacity:
+                    del lines[:self.capacity]
+        kept = lines[-self.capacity:]
+        for line in kept:
+            expression, _, result = line.rstrip("\n").partition("\t")
+            self._store(expression, result)
+        if total >= 2 * self.capacity:
+            # compact: rewrite the append-only file with only the entries still in memory
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.writelines(kept)
+
+
+class HistoryView(ctk.CTkFrame):
+    def __init__(self, master, history, command, rows=12, row_height=28, font=("Consolas", 14), **kwargs):
+        super().__init__(master, **kwargs)
+        self.history = history
+        self.command = command
+        self._items = history
+        self._first = 0
+        self._texts = [None] * rows
+
+        self.grid_columnconfigure(0, weight=1)
+        self.search_entry = ctk.CTkEntry(self, placeholder_text="Search history...")
+        self.search_entry.grid(row=0, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+        self.search_entry.bind("<KeyRelease>", lambda e: self._search())
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, rowspan=rows, sticky="ns")
+
+        # fixed pool of row widgets, re-bound to entries while scrolling
+        self._rows = []
+        for r in range(rows):
+            row = ctk.CTkButton(self, text="", anchor="e", height=row_height, font=font,
+                                fg_color="transparent", command=lambda r=r: self._clicked(r))
+            row.grid(row=r + 1, column=0, sticky="ew", padx=5)
+            row.bind("<MouseWheel>", self._on_wheel)
+            row.bind("<Button-4>", lambda e: self.scroll(-1))
+            row.bind("<Button-5>", lambda e: self.scroll(1))
+            self._rows.append(row)
+        self.refresh()
+
+    def _search(self):
+        self._first = 0
+        self.refresh()
+
+    def _clicked(self, r):
+        index = self._first + r
+        if index < len(self._items):
+            self.command(*self._items[index])
+
+    def scroll(self, rows):
+        self._first = max(0, min(self._first + rows, len(self._items) - len(self._rows)))
+        self._draw()
+
+    def _on_wheel(self, event):
+        self.scroll(-1 if event.delta > 0 else 1)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._first = 0
+            self.scroll(int(float(amount) * len(self._items)))
+        else:
+            self.scroll(int(amount) * (len(self._rows) if unit == "pages" else 1))
+
+    def refresh(self):
+        prefix = self.search_entry.get()
+        self._items = self.history.search(prefix) if prefix else self.history
+        self._draw()
+
+    def _draw(self):
+        total = len(self._items)
+        self._first = max(0, min(self._first, total - len(self._rows)))
+        for r, row in enumerate(self._rows):
+            index = self._first + r
+            text = "{} = {}".format(*self._items[index]) if index < total else ""
+            if text != self._texts[r]:  # only redraw rows whose content changed
+                row.configure(text=text)
+                self._texts[r] = text
+        if total:
+            self.scrollbar.set(self._first / total, min(1.0, (self._first + len(self._rows)) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
@@ -1,8 +1,23 @@
-import customtkinter as ctk
-import tkinter as tk
-import re
+import time
+startup_phases = [("start", time.perf_counter())]
+
 import os
 import sys
+from functools import lru_cache
+
+import customtkinter as ctk
+
+from calc_engine import ERROR, LiveEvaluator, evaluate_expression
+from keypad import build_keypad
+from window_drag import WindowDragger
+
+# --- Startup Phases ---
+# startup is staged: window shell → first frame → calculator widgets → deferred resources
+# run with --startup-timing (or use startup_timing.py) to print how long each phase took
+def mark_phase(name):
+    startup_phases.append((name, time.perf_counter()))
+
+mark_phase("imports")
 
 # --- Window Setup ---
 ctk.set_appearance_mode("dark")
@@ -11,18 +26,13 @@ root.geometry("380x560")
 root.title("ClearMath")
 root.overrideredirect(True)
 
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
+    """ Get absolute path to resource, works for dev and PyInstaller (resolved once per path) """
+    # PyInstaller creates a temp folder and stores path in _MEIPASS
+    base_path = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-root.iconbitmap(resource_path("icon.ico"))
-
 # --- Colors (match your website theme) ---
 BG_COLOR = "#0a0a0a"
 ACCENT = "#1f93ff"
@@ -55,16 +65,17 @@ ctk.CTkButton(title_bar, text="✕", width=35, height=30, corner_radius=8,
               fg_color="#ff1a1a", hover_color=ERROR_COLOR, text_color="white",
               command=root.destroy).pack(side="right", padx=5, pady=5)
 
-# --- Make window draggable ---
-def start_move(e): root.x, root.y = e.x, e.y
-def stop_move(e): root.x = root.y = None
-def on_move(e):
-    deltax, deltay = e.x - root.x, e.y - root.y
-    root.geometry(f"+{root.winfo_x() + deltax}+{root.winfo_y() + deltay}")
-for w in [title_bar, title_label]:
-    w.bind("<ButtonPress-1>", start_move)
-    w.bind("<ButtonRelease-1>", stop_move)
-    w.bind("<B1-Motion>", on_move)
+# --- Make window draggable (one geometry update per frame at most) ---
+dragger = WindowDragger(root, [title_bar, title_label], max_fps=60)
+
+# --- Show the window shell before building the calculator ---
+mark_phase("window shell")
+root.update()
+mark_phase("first frame")
+
+# --- Live Result Preview ---
+preview_label = ctk.CTkLabel(outer, text="", anchor="e", font=("Consolas", 16), text_color="gray60")
+preview_label.pack(fill="x", padx=20)
 
 # --- Entry Field (Display) ---
 main_frame = ctk.CTkFrame(outer, fg_color=BG_COLOR)
@@ -75,72 +86,153 @@ entry = ctk.CTkEntry(main_frame, font=("Consolas", 28, "bold"), justify="right",
                      fg_color=BTN_BG, border_color=ACCENT, text_color=TEXT_COLOR)
 entry.grid(row=0, column=0, columnspan=4, sticky="nsew", padx=5, pady=(0, 20))
 
-# --- Safe Expression Evaluator ---
-def evaluate_expression(expr: str) -> str:
-    try:
-        expr = expr.replace("×", "*").replace("÷", "/")
-        expr = re.sub(r'(\d+)%', r'(\1/100)', expr)
-        while expr and expr[-1] in "+-*/.": expr = expr[:-1]
-        result = eval(expr, {"__builtins__": None}, {})
-        return str(round(result, 6))
-    except Exception:
-        return "Error"
-
 # --- Button Logic ---
-def on_click(char):
-    text = entry.get()
-    if char == "C": entry.delete(0, "end")
-    elif char == "←": entry.delete(len(text)-1)
-    elif char == "=":
-        result = evaluate_expression(text)
-        entry.delete(0, "end")
-        entry.insert("end", result)
-        if result == "Error":
-            entry.configure(border_color=ERROR_COLOR)
-        else:
-            entry.configure(border_color=ACCENT)
+live = LiveEvaluator()
+
+def update_preview():
+    result = live.result() if len(live) else ERROR
+    preview_label.configure(text="" if result == ERROR else f"= {result}")
+
+def clear_display():
+    entry.delete(0, "end")
+    live.clear()
+
+def backspace():
+    entry.delete(entry.index("end") - 1)
+    live.backspace()
+
+def show_result():
+    expression = entry.get()
+    result = evaluate_expression(expression)
+    if result != "Error":
+        get_history().add(expression, result)
+        if history_view is not None: history_view.refresh()
+    entry.delete(0, "end")
+    entry.insert("end", result)
+    live.clear()
+    live.append(result)
+    if result == "Error":
+        entry.configure(border_color=ERROR_COLOR)
     else:
-        entry.insert("end", char)
+        entry.configure(border_color=ACCENT)
+
+def insert_char(char):
+    entry.insert("end", char)
+    live.append(char)
+
+KEY_HANDLERS = {"C": clear_display, "←": backspace, "=": show_result}
+
+def on_click(char):
+    handler = KEY_HANDLERS.get(char)
+    if handler: handler()
+    else: insert_char(char)
+    update_preview()
+
+# keyboard edits bypass on_click: a key typed at the end (or BackSpace, event.char "\b") is fed
+# to the live evaluator directly, pastes and edits elsewhere catch up with the whole entry
+def on_key_release(event):
+    end = entry.index("end")
+    if not live.keystroke(event.char, end, entry.index("insert") == end):
+        live.sync(entry.get())
+    update_preview()
+
+entry.bind("<KeyRelease>", on_key_release)
 
 # --- Button Layout ---
-buttons = [
+KEYPAD = [
     ["C", "←", "÷", "×"],
     ["7", "8", "9", "-"],
     ["4", "5", "6", "+"],
     ["1", "2", "3", "."],
-    ["0", "="]
+    ["0", ("=", 3, "equals")]
 ]
 
-# Generate buttons with Glow Hover effect 
-for r, row in enumerate(buttons, start=1):
-    for c, char in enumerate(row):
-        if r == 5 and c == len(row) - 1:
-            ctk.CTkButton(main_frame, text=char, width=70, height=60,
-                          corner_radius=12, font=("Segoe UI", 22, "bold"),
-                          fg_color=ACCENT, hover_color="#2aa3ff",
-                          text_color="white",
-                          command=lambda ch=char: on_click(ch)).grid(
-                              row=r, column=c, columnspan=3, padx=8, pady=8, sticky="nsew"
-                          )
-            break
-        ctk.CTkButton(main_frame, text=char, width=70, height=60,
-                      corner_radius=12, font=("Segoe UI", 20),
-                      fg_color=BTN_BG, hover_color=BTN_HOVER,
-                      text_color=TEXT_COLOR,
-                      command=lambda ch=char: on_click(ch)).grid(
-                          row=r, column=c, padx=8, pady=8, sticky="nsew"
-                      )
+KEY_STYLES = {
+    "key": {"font": ("Segoe UI", 20), "fg_color": BTN_BG, "hover_color": BTN_HOVER, "text_color": TEXT_COLOR},
+    "equals": {"font": ("Segoe UI", 22, "bold"), "fg_color": ACCENT, "hover_color": "#2aa3ff", "text_color": "white"},
+}
+
+# Generate buttons with Glow Hover effect
+build_keypad(main_frame, KEYPAD, KEY_STYLES, on_click, first_row=1, width=70, height=60, corner_radius=12)
+
+# --- Calculation History ---
+# bounded ring buffer persisted to an append-only file; module and file are loaded on first use
+history = history_window = history_view = None
+
+def get_history():
+    global history
+    if history is None:
+        from history import DEFAULT_PATH, CalculationHistory
+        history = CalculationHistory(capacity=10000, path=DEFAULT_PATH)
+    return history
+
+def recall(expression, result):
+    clear_display()
+    insert_char(expression)
+    update_preview()
+
+def close_history():
+    global history_window, history_view
+    history_window.destroy()
+    history_window = history_view = None
+
+def toggle_history():
+    global history_window, history_view
+    if history_window is not None:
+        close_history()
+        return
+    from history import HistoryView
+    history_window = ctk.CTkToplevel(root, fg_color=BG_COLOR)
+    history_window.title("ClearMath History")
+    history_window.geometry(f"320x460+{root.winfo_x() + root.winfo_width() + 10}+{root.winfo_y()}")
+    history_window.protocol("WM_DELETE_WINDOW", close_history)
+    history_view = HistoryView(history_window, get_history(), recall, rows=12, fg_color=BG_COLOR)
+    history_view.pack(fill="both", expand=True, padx=5, pady=5)
+
+ctk.CTkButton(title_bar, text="☰", width=35, height=30, corner_radius=8,
+              fg_color=BTN_BG, hover_color="#333333", text_color="white",
+              command=toggle_history).pack(side="right", padx=5, pady=5)
 
 # --- Responsive Grid ---
 for i in range(5): main_frame.rowconfigure(i, weight=1)
 for i in range(4): main_frame.columnconfigure(i, weight=1)
 
-# --- Reapply border after minimize ---
-def watch_state():
-    if root.state() == "normal":
+# --- Reapply border after minimize (event driven, no polling) ---
+# the root window's bindtag is shared by every child widget, so only react to events of root itself
+window_events = {"state": "normal", "wakeups": 0, "transitions": 0}
+
+def on_window_event(event):
+    if event.widget is not root: return
+    window_events["wakeups"] += 1
+    state = root.state()
+    if state == window_events["state"]: return
+    window_events["state"] = state
+    window_events["transitions"] += 1
+    if state == "normal":
         try: root.overrideredirect(True)
         except: pass
-    root.after(300, watch_state)
 
-root.after(300, watch_state)
+for sequence in ("<Map>", "<Unmap>", "<Configure>"):
+    root.bind(sequence, on_window_event, add="+")
+
+mark_phase("calculator widgets")
+
+# --- Deferred Resources (loaded once the calculator is on screen) ---
+def load_deferred_resources():
+    root.iconbitmap(resource_path("icon.ico"))
+    get_history().load()
+    mark_phase("deferred resources")
+    if "--startup-timing" in sys.argv:
+        start = startup_phases[0][1]
+        for name, moment in startup_phases[1:]:
+            print(f"startup\t{name}\t{(moment - start) * 1000:.2f}")
+        root.destroy()
+
+# idle callbacks queued now run after the pending redraws, hop once more so that frame is shown
+root.after_idle(lambda: root.after(10, load_deferred_resources))
+
 root.mainloop()
+
+if "--stats" in sys.argv:
+    print(f"window events handled: {window_events['wakeups']}, state transitions: {window_events['transitions']}")
+    print("drag updates:", dragger.stats())
@@ -0,0 +1,66 @@
+"""
+ClearMath startup timing harness
+
+    definition:
+        - Launches ClearMath several times with --startup-timing and collects the phase
+          timestamps it prints (imports, window shell, first frame, calculator widgets,
+          deferred resources).
+        - The first launch is reported as "cold" and the median of the others as "warm".
+          For a true cold start, flush the OS file cache (or reboot) before running.
+        - "process total" is the wall time from launch to exit seen by this harness, so the
+          difference to the in-app phases is interpreter / frozen-bootloader start-up and teardown.
+
+    usage:
+        python startup_timing.py                            → time "python main.py", 5 runs
+        python startup_timing.py --runs 10
+        python startup_timing.py --exe dist/ClearMath.exe   → time a frozen (PyInstaller) build
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def run_once(command):
+    start = time.perf_counter()
+    output = subprocess.run(command + ["--startup-timing"], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    total = (time.perf_counter() - start) * 1000
+    phases = {}
+    for line in output.splitlines():
+        tag, _, rest = line.partition("\t")
+        if tag == "startup":
+            name, _, elapsed = rest.partition("\t")
+            phases[name] = float(elapsed)
+    phases["process total"] = total
+    return phases
+
+
+def per_phase(phases):
+    """ cumulative timestamps → duration of each phase """
+    durations, previous = {}, 0.0
+    for name, elapsed in phases.items():
+        if name == "process total":
+            durations[name] = elapsed
+        else:
+            durations[name] = elapsed - previous
+            previous = elapsed
+    return durations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--exe", help="frozen executable to time instead of main.py")
+    args = parser.parse_args()
+    command = [args.exe] if args.exe else [sys.executable, "main.py"]
+
+    runs = [per_phase(run_once(command)) for _ in range(args.runs)]
+    cold, warm = runs[0], runs[1:] or runs
+    print(f"{'phase':<22}{'cold ms':>10}{'warm ms':>10}")
+    for name in cold:
+        warm_median = statistics.median(run.get(name, 0.0) for run in warm)
+        print(f"{name:<22}{cold[name]:>10.1f}{warm_median:>10.1f}")
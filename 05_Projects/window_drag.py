@@ -0,0 +1,75 @@
+"""
+Draggable window helper
+
+    definition:
+        - Makes a borderless (overrideredirect) window draggable by one or more handle widgets.
+        - Motion events are coalesced: only the latest pointer position is kept, and the window
+          geometry is updated at most once per display frame (max_fps, default 60).
+        - The window origin and pointer position are cached on button press, so no
+          winfo_x() / winfo_y() round trips happen while dragging.
+        - Counts applied vs dropped (coalesced) geometry updates.
+
+    arguments:
+        window          → the window to move (CTk or CTkToplevel)
+        handles         → widgets that start a drag when pressed (e.g. title bar and its label)
+        max_fps         → maximum geometry updates per second
+
+    methods:
+        dragger.stats()     → {"motion_events": n, "applied": n, "dropped": n}
+        dragger.reset_stats()
+"""
+
+import time
+
+
+class WindowDragger:
+    def __init__(self, window, handles, max_fps=60):
+        self.window = window
+        self.frame_interval = 1.0 / max_fps
+        self._origin = None         # (window x, window y, pointer x_root, pointer y_root) at press
+        self._target = None         # latest requested (x, y)
+        self._applied_pos = None
+        self._after_id = None
+        self._last_apply = 0.0
+        self.reset_stats()
+        for handle in handles:
+            handle.bind("<ButtonPress-1>", self._start, add="+")
+            handle.bind("<B1-Motion>", self._motion, add="+")
+            handle.bind("<ButtonRelease-1>", self._stop, add="+")
+
+    def reset_stats(self):
+        self._motion_events = self._applied = 0
+
+    def stats(self):
+        return {"motion_events": self._motion_events,
+                "applied": self._applied,
+                "dropped": self._motion_events - self._applied}
+
+    def _start(self, event):
+        self._origin = (self.window.winfo_x(), self.window.winfo_y(), event.x_root, event.y_root)
+        self._applied_pos = self._origin[:2]
+
+    def _motion(self, event):
+        if self._origin is None:
+            return
+        self._motion_events += 1
+        x, y, pointer_x, pointer_y = self._origin
+        self._target = (x + event.x_root - pointer_x, y + event.y_root - pointer_y)
+        if self._after_id is None:
+            delay = self._last_apply + self.frame_interval - time.perf_counter()
+            self._after_id = self.window.after(max(0, int(delay * 1000)), self._flush)
+
+    def _flush(self):
+        self._after_id = None
+        if self._target is None or self._target == self._applied_pos:
+            return
+        self.window.geometry(f"+{self._target[0]}+{self._target[1]}")
+        self._applied_pos = self._target
+        self._applied += 1
+        self._last_apply = time.perf_counter()
+
+    def _stop(self, event):
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+        self._flush()   # always land exactly where the pointer was released
+        self._origin = self._target = None